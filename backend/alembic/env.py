@@ -14,7 +14,7 @@ from app.core.config import settings
 from app.core.db import Base
 # Import all models to ensure they're registered with Base.metadata
 from app.models import (
-    Tenant, TenantContact, TenantConfig, TenantDeployment,
+    Tenant, TenantContact, TenantConfig, TenantDeployment, TenantDeploymentHealth,
     License, LicenseAuditLog,
     Release,
     Subscription, Invoice, InvoiceLineItem,
@@ -0,0 +1,103 @@
+"""Move per-ping deployment health fields into tenant_deployment_health
+
+Revision ID: 005
+Revises: 004
+Create Date: 2024-01-06 00:00:00.000000
+
+Health reports from every deployed tenant update status, uptime and
+connectivity flags on each ping. Keeping them in a narrow 1:1 side table
+means heartbeats no longer rewrite the wide tenant_deployments row.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "005"
+down_revision: Union[str, None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "tenant_deployment_health",
+        sa.Column(
+            "deployment_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("tenant_deployments.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("status", sa.String(), default="UNKNOWN"),
+        sa.Column("last_health_check", sa.DateTime(), nullable=True),
+        sa.Column("database_healthy", sa.Boolean(), default=True, nullable=True),
+        sa.Column("cache_healthy", sa.Boolean(), default=True, nullable=True),
+        sa.Column("uptime_seconds", sa.Integer(), default=0, nullable=True),
+        sa.Column("last_reported_at", sa.DateTime(), nullable=True),
+    )
+
+    # Copy existing health state across before dropping the old columns
+    op.execute(
+        """
+        INSERT INTO tenant_deployment_health (
+            deployment_id, status, last_health_check, database_healthy,
+            cache_healthy, uptime_seconds, last_reported_at
+        )
+        SELECT id, status, last_health_check, database_healthy,
+               cache_healthy, uptime_seconds, last_reported_at
+        FROM tenant_deployments
+        """
+    )
+
+    op.drop_column("tenant_deployments", "last_reported_at")
+    op.drop_column("tenant_deployments", "uptime_seconds")
+    op.drop_column("tenant_deployments", "cache_healthy")
+    op.drop_column("tenant_deployments", "database_healthy")
+    op.drop_column("tenant_deployments", "last_health_check")
+    op.drop_column("tenant_deployments", "status")
+
+
+def downgrade() -> None:
+    op.add_column(
+        "tenant_deployments",
+        sa.Column("status", sa.String(), default="UNKNOWN"),
+    )
+    op.add_column(
+        "tenant_deployments",
+        sa.Column("last_health_check", sa.DateTime(), nullable=True),
+    )
+    op.add_column(
+        "tenant_deployments",
+        sa.Column("database_healthy", sa.Boolean(), default=True, nullable=True),
+    )
+    op.add_column(
+        "tenant_deployments",
+        sa.Column("cache_healthy", sa.Boolean(), default=True, nullable=True),
+    )
+    op.add_column(
+        "tenant_deployments",
+        sa.Column("uptime_seconds", sa.Integer(), default=0, nullable=True),
+    )
+    op.add_column(
+        "tenant_deployments",
+        sa.Column("last_reported_at", sa.DateTime(), nullable=True),
+    )
+
+    op.execute(
+        """
+        UPDATE tenant_deployments AS d
+        SET status = h.status,
+            last_health_check = h.last_health_check,
+            database_healthy = h.database_healthy,
+            cache_healthy = h.cache_healthy,
+            uptime_seconds = h.uptime_seconds,
+            last_reported_at = h.last_reported_at
+        FROM tenant_deployment_health AS h
+        WHERE h.deployment_id = d.id
+        """
+    )
+
+    op.drop_table("tenant_deployment_health")
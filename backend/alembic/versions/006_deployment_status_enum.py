@@ -0,0 +1,63 @@
+"""Store deployment health status as a native enum
+
+Revision ID: 006
+Revises: 005
+Create Date: 2024-01-07 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "006"
+down_revision: Union[str, None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+deployment_status = postgresql.ENUM(
+    "DEPLOYED",
+    "HEALTHY",
+    "DEGRADED",
+    "UNHEALTHY",
+    "UNKNOWN",
+    name="deploymentstatus",
+)
+
+
+def upgrade() -> None:
+    deployment_status.create(op.get_bind(), checkfirst=True)
+
+    # Free-form values reported before this migration fall back to UNKNOWN
+    op.execute(
+        """
+        UPDATE tenant_deployment_health
+        SET status = 'UNKNOWN'
+        WHERE status IS NULL
+           OR status NOT IN ('DEPLOYED', 'HEALTHY', 'DEGRADED', 'UNHEALTHY', 'UNKNOWN')
+        """
+    )
+    op.alter_column(
+        "tenant_deployment_health",
+        "status",
+        type_=deployment_status,
+        postgresql_using="status::deploymentstatus",
+    )
+
+    op.create_index(
+        "ix_tenant_deployment_health_status", "tenant_deployment_health", ["status"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tenant_deployment_health_status")
+    op.alter_column(
+        "tenant_deployment_health",
+        "status",
+        type_=sa.String(),
+        postgresql_using="status::text",
+    )
+    op.execute("DROP TYPE IF EXISTS deploymentstatus")
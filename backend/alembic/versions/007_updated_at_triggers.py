@@ -0,0 +1,59 @@
+"""Maintain updated_at columns in the database
+
+Revision ID: 007
+Revises: 006
+Create Date: 2024-01-08 00:00:00.000000
+
+updated_at on tenants, webhooks and users is now filled by a server
+default on insert and a BEFORE UPDATE trigger on every update, so the
+application no longer has to stamp it per row.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "007"
+down_revision: Union[str, None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ("tenants", "webhooks", "users")
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION trigger_set_updated_at()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            NEW.updated_at = timezone('utc', now());
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+
+    for table in TABLES:
+        op.alter_column(
+            table,
+            "updated_at",
+            server_default=sa.text("timezone('utc', now())"),
+        )
+        op.execute(
+            f"""
+            CREATE TRIGGER set_updated_at
+            BEFORE UPDATE ON {table}
+            FOR EACH ROW EXECUTE FUNCTION trigger_set_updated_at()
+            """
+        )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS set_updated_at ON {table}")
+        op.alter_column(table, "updated_at", server_default=None)
+
+    op.execute("DROP FUNCTION IF EXISTS trigger_set_updated_at()")
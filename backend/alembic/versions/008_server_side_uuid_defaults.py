@@ -0,0 +1,35 @@
+"""Generate primary keys in the database for append-heavy tables
+
+Revision ID: 008
+Revises: 007
+Create Date: 2024-01-09 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "008"
+down_revision: Union[str, None] = "007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ("webhook_deliveries", "tenant_deployments", "tenant_configs")
+
+
+def upgrade() -> None:
+    # gen_random_uuid() is built in from Postgres 13; pgcrypto covers older servers
+    op.execute("CREATE EXTENSION IF NOT EXISTS pgcrypto")
+
+    for table in TABLES:
+        op.alter_column(
+            table, "id", server_default=sa.text("gen_random_uuid()")
+        )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.alter_column(table, "id", server_default=None)
@@ -0,0 +1,36 @@
+"""Composite index for per-webhook delivery history
+
+Revision ID: 009
+Revises: 008
+Create Date: 2024-01-10 00:00:00.000000
+
+Delivery history is always read for one webhook ordered by delivered_at,
+so a (webhook_id, delivered_at) index serves it without a sort and makes
+the single-column webhook_id index redundant.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "009"
+down_revision: Union[str, None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_webhook_deliveries_webhook_id_delivered_at",
+        "webhook_deliveries",
+        ["webhook_id", "delivered_at"],
+    )
+    op.drop_index("ix_webhook_deliveries_webhook_id")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_webhook_deliveries_webhook_id", "webhook_deliveries", ["webhook_id"]
+    )
+    op.drop_index("ix_webhook_deliveries_webhook_id_delivered_at")
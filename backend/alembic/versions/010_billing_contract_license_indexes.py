@@ -0,0 +1,46 @@
+"""Composite indexes for billing, contract, license and deployment filters
+
+Revision ID: 010
+Revises: 009
+Create Date: 2024-01-11 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "010"
+down_revision: Union[str, None] = "009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Overdue invoices: status + due_date range
+    op.create_index("ix_invoice_status_due", "invoices", ["status", "due_date"])
+    # Tenant invoice listing ordered by created_at
+    op.create_index(
+        "ix_invoice_tenant_created", "invoices", ["tenant_id", "created_at"]
+    )
+    # Expiring contracts: status + end_date range
+    op.create_index("ix_contract_status_end", "contracts", ["status", "end_date"])
+    # Dashboard license-expiry count
+    op.create_index(
+        "ix_license_revoked_expires", "licenses", ["revoked", "expires_at"]
+    )
+    # Dashboard tenants-on-version counts
+    op.create_index(
+        "ix_tenant_deployments_current_version",
+        "tenant_deployments",
+        ["current_version"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tenant_deployments_current_version")
+    op.drop_index("ix_license_revoked_expires")
+    op.drop_index("ix_contract_status_end")
+    op.drop_index("ix_invoice_tenant_created")
+    op.drop_index("ix_invoice_status_due")
@@ -0,0 +1,31 @@
+"""Index for the per-tenant active license lookup
+
+Revision ID: 011
+Revises: 010
+Create Date: 2024-01-12 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "011"
+down_revision: Union[str, None] = "010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Newest unrevoked license for a tenant: equality on (tenant_id, revoked),
+    # then a backward scan on expires_at for ORDER BY ... DESC LIMIT 1
+    op.create_index(
+        "ix_license_tenant_active",
+        "licenses",
+        ["tenant_id", "revoked", "expires_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_license_tenant_active")
@@ -0,0 +1,32 @@
+"""Hash index for license key lookups
+
+Revision ID: 012
+Revises: 011
+Create Date: 2024-01-13 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "012"
+down_revision: Union[str, None] = "011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Validation looks licenses up by the full JWT string (equality only).
+    # A hash index stores a 4-byte hash per row instead of the whole token.
+    op.create_index(
+        "ix_license_key_string",
+        "licenses",
+        ["key_string"],
+        postgresql_using="hash",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_license_key_string")
@@ -0,0 +1,42 @@
+"""Unique (tenant_id, key) on tenant_configs
+
+Revision ID: 013
+Revises: 012
+Create Date: 2024-01-14 00:00:00.000000
+
+set_tenant_config upserts with ON CONFLICT, which needs a unique
+constraint to arbitrate on. The old select-then-insert could race and
+leave duplicate keys, so those are collapsed first.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "013"
+down_revision: Union[str, None] = "012"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keep a single row (highest ctid) of any duplicated key
+    op.execute(
+        """
+        DELETE FROM tenant_configs a
+        USING tenant_configs b
+        WHERE a.tenant_id = b.tenant_id
+          AND a.key = b.key
+          AND a.ctid < b.ctid
+        """
+    )
+    op.create_unique_constraint(
+        "uq_tenant_configs_tenant_id_key", "tenant_configs", ["tenant_id", "key"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        "uq_tenant_configs_tenant_id_key", "tenant_configs", type_="unique"
+    )
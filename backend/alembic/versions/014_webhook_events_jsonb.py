@@ -0,0 +1,50 @@
+"""Store webhook events as JSONB with a GIN index for event lookups
+
+Revision ID: 014
+Revises: 013
+Create Date: 2024-01-15 00:00:00.000000
+
+webhooks.events was created as JSON, which has no containment
+operator, so matching subscribers for an event could not use @> or an
+index. JSONB supports both; the partial GIN index covers only active
+webhooks, which is the only set event dispatch searches.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "014"
+down_revision: Union[str, None] = "013"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "webhooks",
+        "events",
+        type_=postgresql.JSONB(),
+        postgresql_using="events::jsonb",
+    )
+    op.create_index(
+        "ix_webhooks_active_events",
+        "webhooks",
+        ["events"],
+        postgresql_using="gin",
+        postgresql_ops={"events": "jsonb_path_ops"},
+        postgresql_where=sa.text("is_active"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_webhooks_active_events")
+    op.alter_column(
+        "webhooks",
+        "events",
+        type_=postgresql.JSON(),
+        postgresql_using="events::json",
+    )
@@ -0,0 +1,49 @@
+"""Unique tenant_id on tenant_deployments
+
+Revision ID: 015
+Revises: 014
+Create Date: 2024-01-16 00:00:00.000000
+
+Deployment and health reports upsert with ON CONFLICT (tenant_id), which
+needs a unique constraint to arbitrate on. The old get-then-create path
+could race and leave a tenant with several deployment rows, so those are
+collapsed to the most recent one first.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "015"
+down_revision: Union[str, None] = "014"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keep the latest deployment per tenant; health rows cascade with it
+    op.execute(
+        """
+        DELETE FROM tenant_deployments
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, row_number() OVER (
+                    PARTITION BY tenant_id
+                    ORDER BY deployed_at DESC NULLS LAST, ctid DESC
+                ) AS rn
+                FROM tenant_deployments
+            ) ranked
+            WHERE rn > 1
+        )
+        """
+    )
+    op.create_unique_constraint(
+        "uq_tenant_deployments_tenant_id", "tenant_deployments", ["tenant_id"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        "uq_tenant_deployments_tenant_id", "tenant_deployments", type_="unique"
+    )
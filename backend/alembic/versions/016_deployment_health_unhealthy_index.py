@@ -0,0 +1,35 @@
+"""Partial index on unhealthy deployment health rows
+
+Revision ID: 016
+Revises: 015
+Create Date: 2024-01-17 00:00:00.000000
+
+get_unhealthy_deployments filters on status NOT IN ('HEALTHY', 'DEPLOYED'),
+which the plain status index cannot serve. Only a handful of deployments
+are unhealthy at any time, so a partial index over just those rows stays
+tiny and turns the dashboard list into an index scan.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "016"
+down_revision: Union[str, None] = "015"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_tenant_deployment_health_unhealthy",
+        "tenant_deployment_health",
+        ["deployment_id", "last_health_check"],
+        postgresql_where=sa.text("status NOT IN ('HEALTHY', 'DEPLOYED')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tenant_deployment_health_unhealthy")
@@ -0,0 +1,39 @@
+"""Add id to the webhook delivery history index
+
+Revision ID: 017
+Revises: 016
+Create Date: 2024-01-18 00:00:00.000000
+
+Delivery history pages with a (delivered_at, id) keyset instead of OFFSET.
+Including id in the composite index lets a backward scan serve both the
+ORDER BY delivered_at DESC, id DESC and the row-comparison seek, so every
+page costs the same regardless of depth.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "017"
+down_revision: Union[str, None] = "016"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_webhook_deliveries_webhook_id_delivered_at_id",
+        "webhook_deliveries",
+        ["webhook_id", "delivered_at", "id"],
+    )
+    op.drop_index("ix_webhook_deliveries_webhook_id_delivered_at")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_webhook_deliveries_webhook_id_delivered_at",
+        "webhook_deliveries",
+        ["webhook_id", "delivered_at"],
+    )
+    op.drop_index("ix_webhook_deliveries_webhook_id_delivered_at_id")
@@ -1,9 +1,8 @@
 from datetime import timedelta
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import DbSession
 from app.core.config import settings
 from app.core.security import create_access_token
 from app.core.deps import get_current_user
@@ -15,7 +14,7 @@ router = APIRouter()
 
 @router.post("/login", response_model=schemas.Token)
 def login(
-    db: Session = Depends(get_db),
+    db: DbSession,
     form_data: OAuth2PasswordRequestForm = Depends()
 ):
     """
@@ -45,7 +44,7 @@ def login(
 @router.post("/register", response_model=schemas.User)
 def register(
     user_in: schemas.UserCreate,
-    db: Session = Depends(get_db),
+    db: DbSession,
 ):
     """
     Register a new user.
@@ -71,7 +70,7 @@ def read_current_user(
 @router.put("/me", response_model=schemas.User)
 def update_current_user(
     user_in: schemas.UserUpdate,
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -1,9 +1,8 @@
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
 from uuid import UUID
 
-from app.core.db import get_db
+from app.core.db import DbSession
 from app.core.deps import get_current_user
 from app.models.user import User
 from app.schemas import billing as schemas
@@ -16,9 +15,9 @@ router = APIRouter()
 
 @router.get("/subscriptions", response_model=List[schemas.Subscription])
 def list_subscriptions(
+    db: DbSession,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """List all subscriptions with pagination"""
@@ -28,7 +27,7 @@ def list_subscriptions(
 @router.get("/subscriptions/tenant/{tenant_id}", response_model=List[schemas.Subscription])
 def get_tenant_subscriptions(
     tenant_id: UUID,
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user)
 ):
     """Get all subscriptions for a specific tenant"""
@@ -38,7 +37,7 @@ def get_tenant_subscriptions(
 @router.get("/subscriptions/{subscription_id}", response_model=schemas.Subscription)
 def get_subscription(
     subscription_id: UUID,
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user)
 ):
     """Get a specific subscription by ID"""
@@ -51,7 +50,7 @@ def get_subscription(
 @router.post("/subscriptions", response_model=schemas.Subscription)
 def create_subscription(
     sub_in: schemas.SubscriptionCreate,
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user)
 ):
     """Create a new subscription"""
@@ -62,7 +61,7 @@ def create_subscription(
 def update_subscription(
     subscription_id: UUID,
     sub_in: schemas.SubscriptionUpdate,
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user)
 ):
     """Update an existing subscription"""
@@ -75,24 +74,24 @@ def update_subscription(
 @router.post("/subscriptions/{subscription_id}/cancel", response_model=schemas.Subscription)
 def cancel_subscription(
     subscription_id: UUID,
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user)
 ):
     """Cancel a subscription"""
-    subscription = billing_service.get_subscription_by_id(db=db, subscription_id=str(subscription_id))
+    subscription = billing_service.cancel_subscription(db=db, subscription_id=str(subscription_id))
     if not subscription:
         raise HTTPException(status_code=404, detail="Subscription not found")
-    return billing_service.cancel_subscription(db=db, subscription=subscription)
+    return subscription
 
 
 # ===== Invoices =====
 
 @router.get("/invoices", response_model=List[schemas.Invoice])
 def list_invoices(
+    db: DbSession,
     status: Optional[str] = None,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """List all invoices with optional status filter"""
@@ -102,7 +101,7 @@ def list_invoices(
 @router.get("/invoices/tenant/{tenant_id}", response_model=List[schemas.Invoice])
 def get_invoices_by_tenant(
     tenant_id: UUID,
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user)
 ):
     """Get all invoices for a specific tenant"""
@@ -111,7 +110,7 @@ def get_invoices_by_tenant(
 
 @router.get("/invoices/overdue", response_model=List[schemas.Invoice])
 def get_overdue_invoices(
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user)
 ):
     """Get all overdue invoices"""
@@ -121,7 +120,7 @@ def get_overdue_invoices(
 @router.get("/invoices/{invoice_id}", response_model=schemas.Invoice)
 def get_invoice(
     invoice_id: UUID,
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user)
 ):
     """Get a specific invoice by ID"""
@@ -134,7 +133,7 @@ def get_invoice(
 @router.post("/invoices", response_model=schemas.Invoice)
 def create_invoice(
     inv_in: schemas.InvoiceCreate,
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user)
 ):
     """Create a new invoice"""
@@ -145,7 +144,7 @@ def create_invoice(
 def update_invoice(
     invoice_id: UUID,
     inv_in: schemas.InvoiceUpdate,
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user)
 ):
     """Update an existing invoice"""
@@ -158,24 +157,24 @@ def update_invoice(
 @router.post("/invoices/{invoice_id}/pay", response_model=schemas.Invoice)
 def mark_invoice_paid(
     invoice_id: UUID,
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user)
 ):
     """Mark an invoice as paid"""
-    invoice = billing_service.get_invoice_by_id(db=db, invoice_id=str(invoice_id))
+    invoice = billing_service.mark_invoice_paid(db=db, invoice_id=str(invoice_id))
     if not invoice:
         raise HTTPException(status_code=404, detail="Invoice not found")
-    return billing_service.mark_invoice_paid(db=db, invoice=invoice)
+    return invoice
 
 
 @router.post("/invoices/{invoice_id}/void", response_model=schemas.Invoice)
 def void_invoice(
     invoice_id: UUID,
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user)
 ):
     """Void an invoice"""
-    invoice = billing_service.get_invoice_by_id(db=db, invoice_id=str(invoice_id))
+    invoice = billing_service.void_invoice(db=db, invoice_id=str(invoice_id))
     if not invoice:
         raise HTTPException(status_code=404, detail="Invoice not found")
-    return billing_service.void_invoice(db=db, invoice=invoice)
+    return invoice
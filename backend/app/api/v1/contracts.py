@@ -1,9 +1,8 @@
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
 from uuid import UUID
 
-from app.core.db import get_db
+from app.core.db import DbSession
 from app.core.deps import get_current_user
 from app.models.user import User
 from app.schemas import contract as schemas
@@ -14,11 +13,11 @@ router = APIRouter()
 
 @router.get("/", response_model=List[schemas.Contract])
 def list_contracts(
+    db: DbSession,
     tenant_id: Optional[UUID] = None,
     status: Optional[str] = None,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """List all contracts with optional filters"""
@@ -33,8 +32,8 @@ def list_contracts(
 
 @router.get("/expiring", response_model=List[schemas.Contract])
 def get_expiring_contracts(
+    db: DbSession,
     days_ahead: int = 30,
-    db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get contracts expiring within the specified number of days"""
@@ -44,7 +43,7 @@ def get_expiring_contracts(
 @router.get("/{contract_id}", response_model=schemas.Contract)
 def get_contract(
     contract_id: UUID,
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user)
 ):
     """Get a specific contract by ID"""
@@ -57,7 +56,7 @@ def get_contract(
 @router.post("/", response_model=schemas.Contract)
 def create_contract(
     contract_in: schemas.ContractCreate,
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user)
 ):
     """Create a new contract"""
@@ -68,7 +67,7 @@ def create_contract(
 def update_contract(
     contract_id: UUID,
     contract_in: schemas.ContractUpdate,
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user)
 ):
     """Update an existing contract"""
@@ -82,7 +81,7 @@ def update_contract(
 def renew_contract(
     contract_id: UUID,
     renew_data: schemas.ContractRenew,
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user)
 ):
     """Renew a contract with a new end date"""
@@ -100,14 +99,14 @@ def renew_contract(
 @router.post("/{contract_id}/expire", response_model=schemas.Contract)
 def expire_contract(
     contract_id: UUID,
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user)
 ):
     """Mark a contract as expired"""
-    contract = contract_service.get_contract_by_id(db=db, contract_id=str(contract_id))
+    contract = contract_service.expire_contract(db=db, contract_id=str(contract_id))
     if not contract:
         raise HTTPException(status_code=404, detail="Contract not found")
-    return contract_service.expire_contract(db=db, contract=contract)
+    return contract
 
 
 # ===== Contract Assets =====
@@ -115,7 +114,7 @@ def expire_contract(
 @router.get("/{contract_id}/assets", response_model=List[schemas.Asset])
 def get_contract_assets(
     contract_id: UUID,
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user)
 ):
     """Get all assets for a contract"""
@@ -129,7 +128,7 @@ def get_contract_assets(
 def add_contract_asset(
     contract_id: UUID,
     asset_in: schemas.AssetCreate,
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user)
 ):
     """Add an asset to a contract"""
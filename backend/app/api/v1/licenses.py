@@ -1,7 +1,6 @@
 from typing import List, Union
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.core.db import get_db
+from app.core.db import DbSession
 from app.core.deps import get_current_user, verify_api_key
 from app.models.user import User
 from app.schemas import license as schemas
@@ -22,7 +21,7 @@ router = APIRouter()
 )
 def validate_license(
     request: schemas.LicenseValidationRequest,
-    db: Session = Depends(get_db),
+    db: DbSession,
     _: bool = Depends(verify_api_key),
 ):
     """
@@ -73,7 +72,9 @@ def validate_license(
     "/validate/tenant/{tenant_slug}", response_model=schemas.LicenseValidationResponse
 )
 def validate_license_by_tenant(
-    tenant_slug: str, db: Session = Depends(get_db), _: bool = Depends(verify_api_key)
+    tenant_slug: str,
+    db: DbSession,
+    _: bool = Depends(verify_api_key),
 ):
     """
     Validate the active license for a tenant by slug.
@@ -97,9 +98,9 @@ def validate_license_by_tenant(
 
 @router.get("/", response_model=List[schemas.License])
 def list_licenses(
+    db: DbSession,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """List all licenses with pagination"""
@@ -109,7 +110,7 @@ def list_licenses(
 @router.get("/tenant/{tenant_id}", response_model=List[schemas.License])
 def get_licenses_by_tenant(
     tenant_id: UUID,
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user),
 ):
     """Get all licenses for a specific tenant"""
@@ -119,7 +120,7 @@ def get_licenses_by_tenant(
 @router.get("/{license_id}", response_model=schemas.License)
 def get_license(
     license_id: UUID,
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user),
 ):
     """Get a specific license by ID"""
@@ -134,9 +135,9 @@ def get_license(
 )
 def get_license_audit_logs(
     license_id: UUID,
+    db: DbSession,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get audit logs for a specific license"""
@@ -151,7 +152,7 @@ def get_license_audit_logs(
 @router.post("/", response_model=schemas.License)
 def generate_license(
     license_in: schemas.LicenseCreate,
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user),
 ):
     """Generate a new license for a tenant"""
@@ -165,7 +166,7 @@ def generate_license(
 def extend_license(
     license_id: UUID,
     extend_data: schemas.LicenseExtend,
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user),
 ):
     """Extend an existing license by additional days"""
@@ -182,8 +183,8 @@ def extend_license(
 @router.delete("/{license_id}", response_model=schemas.License)
 def revoke_license(
     license_id: UUID,
+    db: DbSession,
     reason: str = "Revoked via API",
-    db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Revoke a license"""
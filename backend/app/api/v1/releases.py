@@ -1,7 +1,6 @@
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.core.db import get_db
+from fastapi import APIRouter, HTTPException
+from app.core.db import DbSession
 from app.schemas import release as schemas
 from app.services import release_service
 
@@ -10,7 +9,7 @@ router = APIRouter()
 @router.post("/", response_model=schemas.Release)
 def create_release(
     release_in: schemas.ReleaseCreate,
-    db: Session = Depends(get_db)
+    db: DbSession
 ):
     if release_service.get_release_by_version(db, release_in.version):
         raise HTTPException(status_code=400, detail="Version already exists")
@@ -18,9 +17,9 @@ def create_release(
 
 @router.get("/", response_model=List[schemas.Release])
 def read_releases(
+    db: DbSession,
     skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db)
+    limit: int = 100
 ):
     return release_service.get_releases(db, skip=skip, limit=limit)
 
@@ -28,7 +27,7 @@ def read_releases(
 def update_release(
     version: str,
     release_in: schemas.ReleaseUpdate,
-    db: Session = Depends(get_db)
+    db: DbSession
 ):
     db_release = release_service.get_release_by_version(db, version)
     if not db_release:
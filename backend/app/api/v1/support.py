@@ -1,9 +1,8 @@
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
 from uuid import UUID
 
-from app.core.db import get_db
+from app.core.db import DbSession
 from app.core.deps import get_current_user
 from app.models.user import User
 from app.schemas import support as schemas
@@ -16,11 +15,11 @@ router = APIRouter()
 
 @router.get("/tickets", response_model=List[schemas.Ticket])
 def list_tickets(
+    db: DbSession,
     tenant_id: Optional[UUID] = None,
     status: Optional[str] = None,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """List all tickets with optional filters"""
@@ -36,7 +35,7 @@ def list_tickets(
 @router.get("/tickets/{ticket_id}", response_model=schemas.Ticket)
 def get_ticket(
     ticket_id: UUID,
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user)
 ):
     """Get a specific ticket by ID"""
@@ -49,7 +48,7 @@ def get_ticket(
 @router.post("/tickets", response_model=schemas.Ticket)
 def create_ticket(
     ticket_in: schemas.TicketCreate,
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user)
 ):
     """Create a new support ticket"""
@@ -60,7 +59,7 @@ def create_ticket(
 def update_ticket(
     ticket_id: UUID,
     ticket_in: schemas.TicketUpdate,
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user)
 ):
     """Update an existing ticket"""
@@ -73,7 +72,7 @@ def update_ticket(
 @router.post("/tickets/{ticket_id}/close", response_model=schemas.Ticket)
 def close_ticket(
     ticket_id: UUID,
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user)
 ):
     """Close a ticket"""
@@ -87,10 +86,10 @@ def close_ticket(
 
 @router.get("/announcements", response_model=List[schemas.Announcement])
 def list_announcements(
+    db: DbSession,
     include_expired: bool = False,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """List all announcements"""
@@ -105,7 +104,7 @@ def list_announcements(
 @router.get("/announcements/{announcement_id}", response_model=schemas.Announcement)
 def get_announcement(
     announcement_id: UUID,
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user)
 ):
     """Get a specific announcement by ID"""
@@ -118,7 +117,7 @@ def get_announcement(
 @router.post("/announcements", response_model=schemas.Announcement)
 def create_announcement(
     announce_in: schemas.AnnouncementCreate,
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user)
 ):
     """Create a new announcement"""
@@ -129,7 +128,7 @@ def create_announcement(
 def update_announcement(
     announcement_id: UUID,
     announce_in: schemas.AnnouncementUpdate,
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user)
 ):
     """Update an existing announcement"""
@@ -142,7 +141,7 @@ def update_announcement(
 @router.delete("/announcements/{announcement_id}")
 def delete_announcement(
     announcement_id: UUID,
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user)
 ):
     """Delete an announcement"""
@@ -1,6 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.core.db import get_db
+from app.core.db import DbSession
 from app.core.deps import verify_api_key
 from app.schemas import telemetry as schemas
 from app.services import telemetry_service
@@ -11,7 +10,7 @@ router = APIRouter()
 @router.post("/ping", response_model=schemas.TelemetryPingResponse)
 def record_telemetry_ping(
     ping_in: schemas.TelemetryPingRequest,
-    db: Session = Depends(get_db),
+    db: DbSession,
     _: bool = Depends(verify_api_key),
 ):
     """
@@ -42,7 +41,7 @@ def record_telemetry_ping(
 @router.post("/ping/internal", response_model=schemas.TelemetryPing)
 def record_telemetry_ping_internal(
     ping_in: schemas.TelemetryPingCreate,
-    db: Session = Depends(get_db),
+    db: DbSession,
     _: bool = Depends(verify_api_key),
 ):
     """
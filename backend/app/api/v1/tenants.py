@@ -1,10 +1,9 @@
 from typing import List, Dict, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import Response
-from sqlalchemy.orm import Session
 from uuid import UUID
 
-from app.core.db import get_db
+from app.core.db import DbSession
 from app.core.deps import get_current_user, verify_api_key
 from app.models.user import User
 from app.schemas import tenant as schemas
@@ -20,7 +19,7 @@ router = APIRouter()
 @router.post("/", response_model=schemas.Tenant)
 def create_tenant(
     tenant_in: schemas.TenantCreate,
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user),
 ):
     """Create a new tenant"""
@@ -34,9 +33,9 @@ def create_tenant(
 
 @router.get("/", response_model=List[schemas.Tenant])
 def list_tenants(
+    db: DbSession,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """List all tenants with pagination"""
@@ -45,9 +44,9 @@ def list_tenants(
 
 @router.get("/deployments/all", response_model=List[schemas.TenantDeployment])
 def list_all_deployments(
+    db: DbSession,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """List all tenant deployments"""
@@ -59,7 +58,7 @@ def list_all_deployments(
 )
 def get_deployments_by_version(
     version: str,
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user),
 ):
     """Get all deployments running a specific version"""
@@ -68,7 +67,8 @@ def get_deployments_by_version(
 
 @router.get("/deployments/unhealthy", response_model=List[schemas.TenantDeployment])
 def get_unhealthy_deployments(
-    db: Session = Depends(get_db), current_user: User = Depends(get_current_user)
+    db: DbSession,
+    current_user: User = Depends(get_current_user),
 ):
     """Get all deployments with non-healthy status"""
     return tenant_service.get_unhealthy_deployments(db=db)
@@ -77,7 +77,7 @@ def get_unhealthy_deployments(
 @router.get("/{slug}", response_model=schemas.Tenant)
 def get_tenant(
     slug: str,
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user),
 ):
     """Get a specific tenant by slug"""
@@ -91,7 +91,7 @@ def get_tenant(
 def update_tenant(
     slug: str,
     tenant_in: schemas.TenantUpdate,
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user),
 ):
     """Update an existing tenant"""
@@ -104,7 +104,7 @@ def update_tenant(
 @router.delete("/{slug}")
 def delete_tenant(
     slug: str,
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user),
 ):
     """Delete a tenant"""
@@ -121,7 +121,7 @@ def delete_tenant(
 @router.get("/{slug}/configs", response_model=List[schemas.TenantConfig])
 def get_tenant_configs(
     slug: str,
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user),
 ):
     """Get all config entries for a tenant"""
@@ -133,7 +133,9 @@ def get_tenant_configs(
 
 @router.get("/{slug}/configs/dict", response_model=schemas.TenantConfigDict)
 def get_tenant_configs_as_dict(
-    slug: str, db: Session = Depends(get_db), _: bool = Depends(verify_api_key)
+    slug: str,
+    db: DbSession,
+    _: bool = Depends(verify_api_key),
 ):
     """
     Get tenant configs as a structured dictionary.
@@ -156,7 +158,7 @@ def get_tenant_configs_as_dict(
 def get_tenant_config(
     slug: str,
     key: str,
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user),
 ):
     """Get a specific config value for a tenant"""
@@ -174,7 +176,7 @@ def set_tenant_config(
     slug: str,
     key: str,
     config_in: schemas.TenantConfigCreate,
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user),
 ):
     """Set or update a config value for a tenant"""
@@ -190,7 +192,7 @@ def set_tenant_config(
 def delete_tenant_config(
     slug: str,
     key: str,
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user),
 ):
     """Delete a config entry for a tenant"""
@@ -211,7 +213,7 @@ def delete_tenant_config(
 @router.get("/{slug}/deployment", response_model=schemas.TenantDeployment)
 def get_tenant_deployment(
     slug: str,
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user),
 ):
     """Get current deployment info for a tenant"""
@@ -230,7 +232,7 @@ def get_tenant_deployment(
 def update_tenant_deployment(
     slug: str,
     deployment_in: schemas.TenantDeploymentCreate,
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user),
 ):
     """Update or create deployment info for a tenant"""
@@ -253,7 +255,7 @@ def update_tenant_deployment(
 def update_deployment_health(
     slug: str,
     health_in: schemas.TenantDeploymentHealthUpdate,
-    db: Session = Depends(get_db),
+    db: DbSession,
     _: bool = Depends(verify_api_key),
 ):
     """
@@ -279,7 +281,7 @@ def update_deployment_health(
     if not tenant:
         raise HTTPException(status_code=404, detail="Tenant not found")
 
-    deployment = tenant_service.update_deployment_health_extended(
+    tenant_service.update_deployment_health_extended(
         db=db,
         tenant_id=str(tenant.id),
         status=health_in.status,
@@ -292,11 +294,6 @@ def update_deployment_health(
         installation_id=health_in.installation_id,
         reported_at=health_in.reported_at,
     )
-    if not deployment:
-        raise HTTPException(
-            status_code=404, detail="No deployment found for this tenant"
-        )
-
     return schemas.TenantDeploymentHealthResponse(acknowledged=True)
 
 
@@ -306,6 +303,7 @@ def update_deployment_health(
 @router.get("/{slug}/install-package")
 def download_installation_package(
     slug: str,
+    db: DbSession,
     docker_image: str = Query(
         default="ghcr.io/riyadmehdi7/churnvision_web_1_0:latest",
         description="Docker image to use in docker-compose.yml",
@@ -313,7 +311,6 @@ def download_installation_package(
     admin_api_url: Optional[str] = Query(
         default=None, description="Admin API URL (defaults to production URL)"
     ),
-    db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """
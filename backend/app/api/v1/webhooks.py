@@ -1,9 +1,9 @@
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
-from sqlalchemy.orm import Session
 from uuid import UUID
 
-from app.core.db import get_db
+from app.core.db import DbSession
 from app.core.deps import get_current_user
 from app.models.user import User
 from app.schemas import webhook as schemas
@@ -14,9 +14,9 @@ router = APIRouter()
 
 @router.get("/", response_model=List[schemas.Webhook])
 def list_webhooks(
+    db: DbSession,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """List all webhooks"""
@@ -26,7 +26,7 @@ def list_webhooks(
 @router.get("/{webhook_id}", response_model=schemas.Webhook)
 def get_webhook(
     webhook_id: UUID,
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user),
 ):
     """Get a specific webhook by ID"""
@@ -39,7 +39,7 @@ def get_webhook(
 @router.post("/", response_model=schemas.Webhook)
 def create_webhook(
     webhook_in: schemas.WebhookCreate,
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user),
 ):
     """Create a new webhook"""
@@ -50,7 +50,7 @@ def create_webhook(
 def update_webhook(
     webhook_id: UUID,
     webhook_in: schemas.WebhookUpdate,
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user),
 ):
     """Update an existing webhook"""
@@ -63,7 +63,7 @@ def update_webhook(
 @router.delete("/{webhook_id}")
 def delete_webhook(
     webhook_id: UUID,
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user),
 ):
     """Delete a webhook"""
@@ -77,7 +77,7 @@ def delete_webhook(
 @router.post("/{webhook_id}/test", response_model=schemas.WebhookTestResponse)
 async def test_webhook(
     webhook_id: UUID,
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user),
 ):
     """Send a test event to a webhook"""
@@ -92,25 +92,36 @@ async def test_webhook(
 @router.get("/{webhook_id}/deliveries", response_model=List[schemas.WebhookDeliveryResponse])
 def get_webhook_deliveries(
     webhook_id: UUID,
+    db: DbSession,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    before: Optional[datetime] = None,
+    before_id: Optional[UUID] = None,
     current_user: User = Depends(get_current_user),
 ):
-    """Get delivery history for a webhook"""
+    """
+    Get delivery history for a webhook, newest first.
+    For deep pages pass the last row's delivered_at as `before` and its id
+    as `before_id` instead of a growing `skip`.
+    """
     webhook = webhook_service.get_webhook_by_id(db=db, webhook_id=str(webhook_id))
     if not webhook:
         raise HTTPException(status_code=404, detail="Webhook not found")
 
     return webhook_service.get_webhook_deliveries(
-        db=db, webhook_id=str(webhook_id), skip=skip, limit=limit
+        db=db,
+        webhook_id=str(webhook_id),
+        skip=skip,
+        limit=limit,
+        before=before,
+        before_id=str(before_id) if before_id else None,
     )
 
 
 @router.post("/trigger", response_model=List[schemas.WebhookDeliveryResponse])
 async def trigger_webhook_event(
     event: schemas.WebhookEventTrigger,
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: User = Depends(get_current_user),
 ):
     """
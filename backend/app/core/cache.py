@@ -0,0 +1,95 @@
+import json
+from datetime import date
+from typing import Any, Optional
+
+import redis
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+_client: Optional[redis.Redis] = None
+
+
+def get_redis() -> Optional[redis.Redis]:
+    """
+    Returns a shared Redis client, or None when REDIS_URL is not configured.
+    Callers treat None as "caching disabled" and go to the database.
+    """
+    global _client
+    if _client is None and settings.REDIS_URL:
+        _client = redis.Redis.from_url(
+            settings.REDIS_URL,
+            socket_timeout=0.5,
+            socket_connect_timeout=0.5,
+        )
+    return _client
+
+
+def _json_default(value: Any) -> Any:
+    # Datetimes come back as ISO strings, which pydantic parses again
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def get_json(key: str) -> Optional[Any]:
+    """Read a JSON value from the cache (None on miss or cache failure)"""
+    client = get_redis()
+    if client is None:
+        return None
+    try:
+        raw = client.get(key)
+    except redis.RedisError as e:
+        logger.warning("Cache read failed", extra={"key": key, "error": str(e)})
+        return None
+    return json.loads(raw) if raw is not None else None
+
+
+def set_json(key: str, value: Any, ttl: int) -> None:
+    """Store a JSON value in the cache with a TTL in seconds"""
+    client = get_redis()
+    if client is None:
+        return
+    try:
+        client.setex(key, ttl, json.dumps(value, default=_json_default))
+    except redis.RedisError as e:
+        logger.warning("Cache write failed", extra={"key": key, "error": str(e)})
+
+
+def delete(*keys: str) -> None:
+    """Invalidate one or more cache keys"""
+    client = get_redis()
+    if client is None or not keys:
+        return
+    try:
+        client.delete(*keys)
+    except redis.RedisError as e:
+        logger.warning("Cache delete failed", extra={"keys": keys, "error": str(e)})
+
+
+_PENDING_DELETES = "cache_pending_deletes"
+
+
+def delete_on_commit(db: Session, *keys: str) -> None:
+    """
+    Invalidate keys once the session's transaction commits. Deleting earlier
+    lets a concurrent read re-cache the pre-commit rows; on rollback nothing
+    changed, so the queued keys are simply dropped.
+    """
+    db.info.setdefault(_PENDING_DELETES, set()).update(keys)
+
+
+@event.listens_for(Session, "after_commit")
+def _delete_pending(session: Session) -> None:
+    keys = session.info.pop(_PENDING_DELETES, None)
+    if keys:
+        delete(*keys)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING_DELETES, None)
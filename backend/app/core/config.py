@@ -33,12 +33,20 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str = "postgres"
     POSTGRES_DB: str = "churnvision_admin"
     DATABASE_URL: Optional[str] = None
+    # Sized for uvicorn's sync threadpool (40 threads): pool + overflow covers
+    # every endpoint running at once without waiting on a connection
+    DB_POOL_SIZE: int = 30
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 3600  # seconds; below managed-PG idle timeouts
 
     def assemble_db_url(self) -> str:
         if self.DATABASE_URL:
             return self.DATABASE_URL
         return f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_SERVER}/{self.POSTGRES_DB}"
 
+    # Cache (optional - caching is disabled when unset)
+    REDIS_URL: Optional[str] = None
+
     # Security
     SECRET_KEY: str = os.getenv("SECRET_KEY", "dev-secret-key-change-in-production")
     ALGORITHM: str = "HS256"
@@ -1,17 +1,45 @@
+from typing import Annotated
+
+from fastapi import Depends
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
 from app.core.config import settings
 
 SQLALCHEMY_DATABASE_URL = settings.assemble_db_url()
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=True,
+    # Reuse the most recently returned connection so a few stay hot and the
+    # rest can idle out after a burst
+    pool_use_lifo=True,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
 def get_db():
+    """
+    Request-scoped session. Services flush their changes; the whole request
+    is committed once here, or rolled back if the handler raised.
+    Routes depend on this with scope="function" so the commit happens
+    before the response is sent. Cache keys queued by services with
+    cache.delete_on_commit are cleared right after that commit.
+    """
     db = SessionLocal()
     try:
         yield db
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
     finally:
         db.close()
+
+
+# Routes and dependencies take the session through this alias so every one
+# of them gets the function scope (commit before the response is sent)
+DbSession = Annotated[Session, Depends(get_db, scope="function")]
@@ -3,10 +3,9 @@ from fastapi import Depends, HTTPException, status, Header
 from fastapi.security import OAuth2PasswordBearer, APIKeyHeader
 from jose import jwt, JWTError
 from pydantic import ValidationError
-from sqlalchemy.orm import Session
 
 from app.core.config import settings
-from app.core.db import get_db
+from app.core.db import DbSession
 from app.models.user import User
 from app.services import user_service
 from app.schemas.user import TokenPayload
@@ -19,7 +18,7 @@ oauth2_scheme = OAuth2PasswordBearer(
 api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 
 def get_current_user(
-    db: Session = Depends(get_db),
+    db: DbSession,
     token: str = Depends(oauth2_scheme)
 ) -> User:
     """
@@ -59,7 +58,7 @@ def get_current_user(
     return user
 
 def get_current_user_optional(
-    db: Session = Depends(get_db),
+    db: DbSession,
     token: Optional[str] = Depends(oauth2_scheme)
 ) -> Optional[User]:
     """
@@ -120,9 +119,9 @@ def verify_api_key(
 
 
 def verify_api_key_or_user(
+    db: DbSession,
     api_key: Optional[str] = Depends(api_key_header),
     token: Optional[str] = Depends(oauth2_scheme),
-    db: Session = Depends(get_db),
 ) -> Optional[User]:
     """
     Validates either API key (for service calls) or user token (for UI calls).
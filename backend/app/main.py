@@ -1,28 +1,37 @@
+from contextlib import asynccontextmanager
 from datetime import datetime
-from fastapi import FastAPI, Depends
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
 from sqlalchemy import text
 
 from app.api.v1.api import api_router
 from app.core.config import settings
-from app.core.db import get_db
+from app.core.db import DbSession
 from app.core.logging_config import setup_logging, get_logger
 from app.middleware import (
     LoggingMiddleware,
     ErrorHandlerMiddleware,
     RateLimiterMiddleware,
 )
+from app.services import webhook_service
 
 # Initialize logging
 setup_logging(log_level=settings.LOG_LEVEL, json_logs=settings.JSON_LOGS)
 logger = get_logger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await webhook_service.close_http_client()
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     description="Internal control plane for ChurnVision Enterprise",
     version="0.1.0",
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    lifespan=lifespan,
 )
 
 # Add middleware (order matters - first added = outermost)
@@ -49,7 +58,7 @@ def health_check():
 
 
 @app.get("/health/detailed")
-def detailed_health_check(db: Session = Depends(get_db)):
+def detailed_health_check(db: DbSession):
     """
     Comprehensive health check endpoint.
     Checks database connectivity and returns detailed status.
@@ -77,7 +86,7 @@ def detailed_health_check(db: Session = Depends(get_db)):
 
 
 @app.get("/ready")
-def readiness_check(db: Session = Depends(get_db)):
+def readiness_check(db: DbSession):
     """
     Kubernetes-style readiness probe.
     Returns 200 if the service is ready to accept traffic.
@@ -101,7 +110,7 @@ def liveness_check():
 
 
 @app.get("/debug/tables")
-def debug_tables(db: Session = Depends(get_db)):
+def debug_tables(db: DbSession):
     """Debug endpoint to check database tables"""
     try:
         # Check what tables exist
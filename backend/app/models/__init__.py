@@ -1,4 +1,4 @@
-from .tenant import Tenant, TenantContact, TenantConfig, TenantDeployment
+from .tenant import Tenant, TenantContact, TenantConfig, TenantDeployment, TenantDeploymentHealth
 from .license import License, LicenseAuditLog
 from .release import Release, ReleaseTrack, ReleaseStatus
 from .billing import Subscription, Invoice, InvoiceLineItem, PricingPlan, SubscriptionStatus, InvoiceStatus
@@ -1,6 +1,6 @@
 import uuid
 import enum
-from sqlalchemy import Column, String, Integer, DateTime, Date, Numeric, ForeignKey, Enum, Boolean
+from sqlalchemy import Column, String, Integer, DateTime, Date, Numeric, ForeignKey, Enum, Boolean, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -46,6 +46,10 @@ class Subscription(Base):
 
 class Invoice(Base):
     __tablename__ = "invoices"
+    __table_args__ = (
+        Index("ix_invoice_status_due", "status", "due_date"),
+        Index("ix_invoice_tenant_created", "tenant_id", "created_at"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     subscription_id = Column(UUID(as_uuid=True), ForeignKey("subscriptions.id"), nullable=True)
@@ -62,6 +66,7 @@ class Invoice(Base):
     due_date = Column(Date, nullable=False)
     paid_at = Column(DateTime, nullable=True)
     pdf_url = Column(String, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
 
     subscription = relationship("Subscription", back_populates="invoices")
     line_items = relationship("InvoiceLineItem", back_populates="invoice", cascade="all, delete-orphan")
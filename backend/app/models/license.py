@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, JSON, Boolean
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, JSON, Boolean, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -8,6 +8,11 @@ from app.core.db import Base
 
 class License(Base):
     __tablename__ = "licenses"
+    __table_args__ = (
+        Index("ix_license_revoked_expires", "revoked", "expires_at"),
+        Index("ix_license_tenant_active", "tenant_id", "revoked", "expires_at"),
+        Index("ix_license_key_string", "key_string", postgresql_using="hash"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     tenant_id = Column(UUID(as_uuid=True), ForeignKey("tenants.id"), nullable=False)
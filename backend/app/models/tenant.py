@@ -9,8 +9,14 @@ from sqlalchemy import (
     JSON,
     Boolean,
     ForeignKey,
+    FetchedValue,
+    func,
+    text,
+    UniqueConstraint,
+    Index,
 )
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.associationproxy import association_proxy
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.core.db import Base
@@ -29,6 +35,40 @@ class PricingTier(str, enum.Enum):
     PROFESSIONAL = "PROFESSIONAL"
     ENTERPRISE = "ENTERPRISE"
 
+    @property
+    def features(self) -> tuple:
+        """Features enabled by default for tenants on this tier"""
+        return _TIER_FEATURES[self]
+
+
+_TIER_FEATURES = {
+    PricingTier.STARTER: ("home", "data-management", "settings"),
+    PricingTier.PROFESSIONAL: (
+        "home",
+        "data-management",
+        "settings",
+        "ai-assistant",
+        "knowledge-base",
+    ),
+    PricingTier.ENTERPRISE: (
+        "home",
+        "data-management",
+        "settings",
+        "ai-assistant",
+        "knowledge-base",
+        "playground",
+        "gdpr",
+    ),
+}
+
+
+class DeploymentStatus(str, enum.Enum):
+    DEPLOYED = "DEPLOYED"
+    HEALTHY = "HEALTHY"
+    DEGRADED = "DEGRADED"
+    UNHEALTHY = "UNHEALTHY"
+    UNKNOWN = "UNKNOWN"
+
 
 class Tenant(Base):
     __tablename__ = "tenants"
@@ -50,7 +90,11 @@ class Tenant(Base):
     contract_start = Column(Date, nullable=True)
     contract_end = Column(Date, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = Column(
+        DateTime,
+        server_default=func.timezone("utc", func.now()),
+        server_onupdate=FetchedValue(),
+    )
 
     # Metadata
     industry = Column(String, nullable=True)
@@ -90,8 +134,15 @@ class TenantContact(Base):
 
 class TenantConfig(Base):
     __tablename__ = "tenant_configs"
+    __table_args__ = (
+        UniqueConstraint("tenant_id", "key", name="uq_tenant_configs_tenant_id_key"),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        server_default=text("gen_random_uuid()"),
+    )
     tenant_id = Column(UUID(as_uuid=True), ForeignKey("tenants.id"), nullable=False)
     key = Column(String, nullable=False)
     value = Column(String, nullable=False)
@@ -102,23 +153,66 @@ class TenantConfig(Base):
 # Deployment model for release tracking
 class TenantDeployment(Base):
     __tablename__ = "tenant_deployments"
+    __table_args__ = (
+        UniqueConstraint("tenant_id", name="uq_tenant_deployments_tenant_id"),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        server_default=text("gen_random_uuid()"),
+    )
     tenant_id = Column(UUID(as_uuid=True), ForeignKey("tenants.id"), nullable=False)
-    current_version = Column(String, nullable=False)
+    current_version = Column(String, nullable=False, index=True)
     deployed_at = Column(DateTime, default=datetime.utcnow)
     deployed_by = Column(String, nullable=True)
     environment = Column(String, default="production")
-    last_health_check = Column(DateTime, nullable=True)
-    status = Column(String, default="UNKNOWN")  # HEALTHY, DEGRADED, UNHEALTHY
 
-    # Extended health fields (ChurnVision integration spec)
-    database_healthy = Column(Boolean, default=True, nullable=True)
-    cache_healthy = Column(Boolean, default=True, nullable=True)
-    uptime_seconds = Column(Integer, default=0, nullable=True)
+    # Extended installation fields (ChurnVision integration spec)
     platform = Column(String, nullable=True)
     python_version = Column(String, nullable=True)
     installation_id = Column(String, nullable=True)
-    last_reported_at = Column(DateTime, nullable=True)
 
     tenant = relationship("Tenant", back_populates="deployments")
+    health = relationship(
+        "TenantDeploymentHealth",
+        back_populates="deployment",
+        uselist=False,
+        lazy="joined",
+        cascade="all, delete-orphan",
+    )
+
+    # Health fields live on the narrow side table; exposed here for schemas
+    status = association_proxy("health", "status")
+    last_health_check = association_proxy("health", "last_health_check")
+
+
+# Per-ping health state, kept apart from the deployment row so heartbeats
+# only rewrite this narrow tuple
+class TenantDeploymentHealth(Base):
+    __tablename__ = "tenant_deployment_health"
+    __table_args__ = (
+        # Serves get_unhealthy_deployments; only non-healthy rows are indexed
+        Index(
+            "ix_tenant_deployment_health_unhealthy",
+            "deployment_id",
+            "last_health_check",
+            postgresql_where=text("status NOT IN ('HEALTHY', 'DEPLOYED')"),
+        ),
+    )
+
+    deployment_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("tenant_deployments.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    status = Column(
+        Enum(DeploymentStatus), default=DeploymentStatus.UNKNOWN, index=True
+    )
+    last_health_check = Column(DateTime, nullable=True)
+    database_healthy = Column(Boolean, default=True, nullable=True)
+    cache_healthy = Column(Boolean, default=True, nullable=True)
+    uptime_seconds = Column(Integer, default=0, nullable=True)
+    last_reported_at = Column(DateTime, nullable=True)
+
+    deployment = relationship("TenantDeployment", back_populates="health")
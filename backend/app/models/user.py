@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, Boolean, DateTime
+from sqlalchemy import Column, String, Boolean, DateTime, FetchedValue, func
 from sqlalchemy.dialects.postgresql import UUID
 from datetime import datetime
 from app.core.db import Base
@@ -14,4 +14,8 @@ class User(Base):
     is_active = Column(Boolean, default=True)
     is_superuser = Column(Boolean, default=False)
     created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = Column(
+        DateTime,
+        server_default=func.timezone("utc", func.now()),
+        server_onupdate=FetchedValue(),
+    )
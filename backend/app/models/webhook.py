@@ -1,7 +1,18 @@
 import uuid
 import enum
-from sqlalchemy import Column, String, Boolean, DateTime, Enum, JSON
-from sqlalchemy.dialects.postgresql import UUID, ARRAY
+from sqlalchemy import (
+    Column,
+    String,
+    Boolean,
+    DateTime,
+    Enum,
+    JSON,
+    Index,
+    FetchedValue,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from datetime import datetime
 from app.core.db import Base
 
@@ -42,15 +53,29 @@ class WebhookEventType(str, enum.Enum):
 
 class Webhook(Base):
     __tablename__ = "webhooks"
+    __table_args__ = (
+        # Serves events @> '["<type>"]' lookups for active webhooks
+        Index(
+            "ix_webhooks_active_events",
+            "events",
+            postgresql_using="gin",
+            postgresql_ops={"events": "jsonb_path_ops"},
+            postgresql_where=text("is_active"),
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String, nullable=False)
     url = Column(String, nullable=False)
     secret = Column(String, nullable=True)  # For HMAC signature verification
-    events = Column(ARRAY(String), default=[])  # List of event types to subscribe to
+    events = Column(JSONB, default=list)  # List of event types to subscribe to
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = Column(
+        DateTime,
+        server_default=func.timezone("utc", func.now()),
+        server_onupdate=FetchedValue(),
+    )
 
     # Optional filters
     tenant_id = Column(UUID(as_uuid=True), nullable=True)  # Filter events for specific tenant
@@ -58,8 +83,21 @@ class Webhook(Base):
 
 class WebhookDelivery(Base):
     __tablename__ = "webhook_deliveries"
+    __table_args__ = (
+        # Serves per-webhook delivery history (newest first, keyset paged)
+        Index(
+            "ix_webhook_deliveries_webhook_id_delivered_at_id",
+            "webhook_id",
+            "delivered_at",
+            "id",
+        ),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        server_default=text("gen_random_uuid()"),
+    )
     webhook_id = Column(UUID(as_uuid=True), nullable=False)
     event_type = Column(String, nullable=False)
     payload = Column(JSON, nullable=False)
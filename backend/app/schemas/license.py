@@ -87,7 +87,7 @@ class LicenseValidationResponse(BaseModel):
     license_tier: str = Field(..., description="License tier: starter, pro, enterprise")
     company_name: str = Field(..., description="Tenant/company name")
     max_employees: Optional[int] = Field(None, description="Maximum employees allowed")
-    expires_at: str = Field(..., description="License expiration datetime ISO format")
+    expires_at: datetime = Field(..., description="License expiration datetime")
     features: List[str] = Field(
         default_factory=list, description="List of enabled features"
     )
@@ -97,7 +97,7 @@ class LicenseValidationResponse(BaseModel):
     revocation_reason: Optional[str] = Field(
         None, description="Reason for revocation if revoked"
     )
-    revoked_at: Optional[str] = Field(
+    revoked_at: Optional[datetime] = Field(
         None, description="Revocation datetime if revoked"
     )
 
@@ -105,7 +105,7 @@ class LicenseValidationResponse(BaseModel):
     license_id: Optional[str] = None
     tenant_id: Optional[str] = None
     tenant_slug: Optional[str] = None
-    issued_at: Optional[str] = None
+    issued_at: Optional[datetime] = None
     days_until_expiry: Optional[int] = None
 
 
@@ -116,7 +116,7 @@ class LicenseValidationErrorResponse(BaseModel):
     error: str
     revoked: Optional[bool] = None
     revocation_reason: Optional[str] = None
-    revoked_at: Optional[str] = None
+    revoked_at: Optional[datetime] = None
 
 
 class LicenseValidationError(BaseModel):
@@ -2,7 +2,7 @@ from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, EmailStr, Field
 from datetime import datetime, date
 from uuid import UUID
-from app.models.tenant import TenantStatus, PricingTier
+from app.models.tenant import TenantStatus, PricingTier, DeploymentStatus
 
 
 # Contact Schemas
@@ -104,7 +104,7 @@ class TenantDeployment(TenantDeploymentBase):
     deployed_at: datetime
     deployed_by: Optional[str]
     last_health_check: Optional[datetime]
-    status: str
+    status: DeploymentStatus
 
     class Config:
         from_attributes = True
@@ -1,7 +1,9 @@
 from datetime import date, timedelta
 from typing import List, Optional
+from sqlalchemy import insert, update
 from sqlalchemy.orm import Session
 from app.models.billing import Subscription, Invoice, InvoiceLineItem, InvoiceStatus, SubscriptionStatus
+from app.services import dashboard_service
 
 from app.schemas.billing import SubscriptionCreate, SubscriptionUpdate, InvoiceCreate, InvoiceUpdate
 
@@ -32,8 +34,8 @@ def create_subscription(db: Session, sub_in: SubscriptionCreate) -> Subscription
         payment_method=sub_in.payment_method
     )
     db.add(db_sub)
-    db.commit()
-    db.refresh(db_sub)
+    db.flush()
+    dashboard_service.invalidate_dashboard_stats(db)
     return db_sub
 
 
@@ -41,15 +43,21 @@ def update_subscription(db: Session, subscription: Subscription, sub_in: Subscri
     update_data = sub_in.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(subscription, field, value)
-    db.commit()
-    db.refresh(subscription)
+    db.flush()
+    dashboard_service.invalidate_dashboard_stats(db)
     return subscription
 
 
-def cancel_subscription(db: Session, subscription: Subscription) -> Subscription:
-    subscription.status = SubscriptionStatus.CANCELLED
-    db.commit()
-    db.refresh(subscription)
+def cancel_subscription(db: Session, subscription_id: str) -> Optional[Subscription]:
+    """Cancel a subscription in a single UPDATE ... RETURNING (None if not found)"""
+    subscription = db.scalars(
+        update(Subscription)
+        .where(Subscription.id == subscription_id)
+        .values(status=SubscriptionStatus.CANCELLED)
+        .returning(Subscription)
+    ).first()
+    if subscription:
+        dashboard_service.invalidate_dashboard_stats(db)
     return subscription
 
 
@@ -79,17 +87,22 @@ def create_invoice(db: Session, inv_in: InvoiceCreate) -> Invoice:
     db.add(db_inv)
     db.flush()
 
-    for item in inv_in.line_items:
-        db_item = InvoiceLineItem(
-            invoice_id=db_inv.id,
-            description=item.description,
-            amount=item.amount,
-            quantity=item.quantity
+    # Insert all line items in a single executemany
+    if inv_in.line_items:
+        db.execute(
+            insert(InvoiceLineItem),
+            [
+                {
+                    "invoice_id": db_inv.id,
+                    "description": item.description,
+                    "amount": item.amount,
+                    "quantity": item.quantity,
+                }
+                for item in inv_in.line_items
+            ],
         )
-        db.add(db_item)
 
-    db.commit()
-    db.refresh(db_inv)
+    dashboard_service.invalidate_dashboard_stats(db)
     return db_inv
 
 
@@ -97,24 +110,35 @@ def update_invoice(db: Session, invoice: Invoice, inv_in: InvoiceUpdate) -> Invo
     update_data = inv_in.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(invoice, field, value)
-    db.commit()
-    db.refresh(invoice)
+    db.flush()
+    dashboard_service.invalidate_dashboard_stats(db)
     return invoice
 
 
-def mark_invoice_paid(db: Session, invoice: Invoice) -> Invoice:
+def mark_invoice_paid(db: Session, invoice_id: str) -> Optional[Invoice]:
+    """Mark an invoice paid in a single UPDATE ... RETURNING (None if not found)"""
     from datetime import datetime
-    invoice.status = InvoiceStatus.PAID
-    invoice.paid_at = datetime.utcnow()
-    db.commit()
-    db.refresh(invoice)
+    invoice = db.scalars(
+        update(Invoice)
+        .where(Invoice.id == invoice_id)
+        .values(status=InvoiceStatus.PAID, paid_at=datetime.utcnow())
+        .returning(Invoice)
+    ).first()
+    if invoice:
+        dashboard_service.invalidate_dashboard_stats(db)
     return invoice
 
 
-def void_invoice(db: Session, invoice: Invoice) -> Invoice:
-    invoice.status = InvoiceStatus.VOID
-    db.commit()
-    db.refresh(invoice)
+def void_invoice(db: Session, invoice_id: str) -> Optional[Invoice]:
+    """Void an invoice in a single UPDATE ... RETURNING (None if not found)"""
+    invoice = db.scalars(
+        update(Invoice)
+        .where(Invoice.id == invoice_id)
+        .values(status=InvoiceStatus.VOID)
+        .returning(Invoice)
+    ).first()
+    if invoice:
+        dashboard_service.invalidate_dashboard_stats(db)
     return invoice
 
 
@@ -1,5 +1,6 @@
 from typing import List, Optional
 from datetime import date
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 from app.models.contract import Contract, ContractStatus, Asset
 from app.schemas.contract import ContractCreate, ContractUpdate
@@ -31,8 +32,7 @@ def create_contract(db: Session, contract_in: ContractCreate) -> Contract:
         document_url=contract_in.document_url
     )
     db.add(db_contract)
-    db.commit()
-    db.refresh(db_contract)
+    db.flush()
     return db_contract
 
 
@@ -40,8 +40,7 @@ def update_contract(db: Session, contract: Contract, contract_in: ContractUpdate
     update_data = contract_in.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(contract, field, value)
-    db.commit()
-    db.refresh(contract)
+    db.flush()
     return contract
 
 
@@ -53,16 +52,18 @@ def renew_contract(db: Session, contract: Contract, new_end_date: date, new_valu
     contract.renewal_reminder_sent = False
     if new_value:
         contract.total_contract_value = new_value
-    db.commit()
-    db.refresh(contract)
+    db.flush()
     return contract
 
 
-def expire_contract(db: Session, contract: Contract) -> Contract:
-    contract.status = ContractStatus.EXPIRED
-    db.commit()
-    db.refresh(contract)
-    return contract
+def expire_contract(db: Session, contract_id: str) -> Optional[Contract]:
+    """Expire a contract in a single UPDATE ... RETURNING (None if not found)"""
+    return db.scalars(
+        update(Contract)
+        .where(Contract.id == contract_id)
+        .values(status=ContractStatus.EXPIRED)
+        .returning(Contract)
+    ).first()
 
 
 def get_expiring_contracts(db: Session, days_ahead: int = 30) -> List[Contract]:
@@ -88,11 +89,10 @@ def add_contract_asset(db: Session, contract_id: str, name: str, asset_type: str
         url=url
     )
     db.add(db_asset)
-    db.commit()
-    db.refresh(db_asset)
+    db.flush()
     return db_asset
 
 
 def delete_contract_asset(db: Session, asset: Asset) -> None:
     db.delete(asset)
-    db.commit()
+    db.flush()
@@ -1,99 +1,138 @@
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import Float, String, case, cast, desc, func, select, union_all
 from app.models.tenant import Tenant, TenantStatus, TenantDeployment
 from app.models.license import License
 from app.models.billing import Invoice, InvoiceStatus, Subscription, SubscriptionStatus
 from app.models.release import Release, ReleaseStatus
+from app.core import cache
+
+DASHBOARD_STATS_CACHE_KEY = "dashboard:stats"
+DASHBOARD_STATS_TTL = 30  # seconds
+
+
+def _count(column, *criteria):
+    """Scalar COUNT subquery so several counters can share one round-trip"""
+    return select(func.count(column)).where(*criteria).scalar_subquery()
+
+
+def invalidate_dashboard_stats(db: Session) -> None:
+    """Drop cached dashboard stats once a mutation that affects them commits"""
+    cache.delete_on_commit(db, DASHBOARD_STATS_CACHE_KEY)
+
 
 def get_dashboard_stats(db: Session) -> dict:
-    # Tenant counts
-    total_tenants = db.query(func.count(Tenant.id)).scalar() or 0
-    active_tenants = db.query(func.count(Tenant.id)).filter(
-        Tenant.status == TenantStatus.ACTIVE
-    ).scalar() or 0
-    trial_tenants = db.query(func.count(Tenant.id)).filter(
-        Tenant.status == TenantStatus.TRIAL
-    ).scalar() or 0
-
-    # MRR calculation from active subscriptions
-    mrr_result = db.query(func.sum(Subscription.base_price)).filter(
-        Subscription.status == SubscriptionStatus.ACTIVE
-    ).scalar()
-    mrr = float(mrr_result) if mrr_result else 0.0
-
-    # Get latest published release version
-    latest_release = db.query(Release).filter(
-        Release.status == ReleaseStatus.PUBLISHED
-    ).order_by(Release.published_at.desc()).first()
-    latest_version = latest_release.version if latest_release else "N/A"
-
-    # Count tenants on latest version
-    tenants_on_latest = 0
-    if latest_release:
-        tenants_on_latest = db.query(func.count(TenantDeployment.id)).filter(
-            TenantDeployment.current_version == latest_version
-        ).scalar() or 0
-
-    # Licenses expiring in 30 days
-    thirty_days_from_now = datetime.utcnow() + timedelta(days=30)
-    expiring_licenses_count = db.query(func.count(License.id)).filter(
-        License.expires_at <= thirty_days_from_now,
-        License.expires_at > datetime.utcnow(),
-        License.revoked == False
-    ).scalar() or 0
-
-    # Overdue invoices
-    overdue_invoices_count = db.query(func.count(Invoice.id)).filter(
-        Invoice.status == InvoiceStatus.OVERDUE
-    ).scalar() or 0
-
-    # Tenants on deprecated versions
-    deprecated_versions = db.query(Release.version).filter(
-        Release.status == ReleaseStatus.DEPRECATED
-    ).subquery()
-    deprecated_version_tenants = db.query(func.count(TenantDeployment.id)).filter(
-        TenantDeployment.current_version.in_(deprecated_versions)
-    ).scalar() or 0
-
-    return {
-        "total_tenants": total_tenants,
-        "active_tenants": active_tenants,
-        "trial_tenants": trial_tenants,
-        "mrr": mrr,
-        "latest_version": latest_version,
-        "tenants_on_latest": tenants_on_latest,
-        "expiring_licenses_count": expiring_licenses_count,
-        "overdue_invoices_count": overdue_invoices_count,
-        "deprecated_version_tenants": deprecated_version_tenants,
+    cached = cache.get_json(DASHBOARD_STATS_CACHE_KEY)
+    if cached is not None:
+        return cached
+
+    now = datetime.utcnow()
+    thirty_days_from_now = now + timedelta(days=30)
+
+    # Latest published release version
+    latest_version = (
+        select(Release.version)
+        .where(Release.status == ReleaseStatus.PUBLISHED)
+        .order_by(Release.published_at.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+
+    # All counters are evaluated in a single statement
+    stats = db.query(
+        _count(Tenant.id).label("total_tenants"),
+        _count(Tenant.id, Tenant.status == TenantStatus.ACTIVE).label(
+            "active_tenants"
+        ),
+        _count(Tenant.id, Tenant.status == TenantStatus.TRIAL).label(
+            "trial_tenants"
+        ),
+        # MRR calculation from active subscriptions
+        select(cast(func.coalesce(func.sum(Subscription.base_price), 0), Float))
+        .where(Subscription.status == SubscriptionStatus.ACTIVE)
+        .scalar_subquery()
+        .label("mrr"),
+        latest_version.label("latest_version"),
+        # Tenants on latest version (NULL version matches nothing)
+        _count(
+            TenantDeployment.id, TenantDeployment.current_version == latest_version
+        ).label("tenants_on_latest"),
+        # Licenses expiring in 30 days
+        _count(
+            License.id,
+            License.expires_at <= thirty_days_from_now,
+            License.expires_at > now,
+            License.revoked == False,
+        ).label("expiring_licenses_count"),
+        # Overdue invoices
+        _count(Invoice.id, Invoice.status == InvoiceStatus.OVERDUE).label(
+            "overdue_invoices_count"
+        ),
+        # Tenants on deprecated versions (Release.version is unique, so the
+        # join cannot double-count a deployment)
+        select(func.count(TenantDeployment.id))
+        .join(Release, Release.version == TenantDeployment.current_version)
+        .where(Release.status == ReleaseStatus.DEPRECATED)
+        .scalar_subquery()
+        .label("deprecated_version_tenants"),
+    ).one()
+
+    result = {
+        "total_tenants": stats.total_tenants,
+        "active_tenants": stats.active_tenants,
+        "trial_tenants": stats.trial_tenants,
+        "mrr": stats.mrr,
+        "latest_version": stats.latest_version or "N/A",
+        "tenants_on_latest": stats.tenants_on_latest,
+        "expiring_licenses_count": stats.expiring_licenses_count,
+        "overdue_invoices_count": stats.overdue_invoices_count,
+        "deprecated_version_tenants": stats.deprecated_version_tenants,
     }
+    cache.set_json(DASHBOARD_STATS_CACHE_KEY, result, DASHBOARD_STATS_TTL)
+    return result
+
 
 def get_recent_activity(db: Session, limit: int = 10) -> list:
-    # Get recent tenant creations and license events
-    activities = []
-
-    # Recent tenants
-    recent_tenants = db.query(Tenant).order_by(Tenant.created_at.desc()).limit(limit).all()
-    for tenant in recent_tenants:
-        activities.append({
-            "id": str(tenant.id),
-            "tenant_name": tenant.name,
-            "action": f"started {tenant.status.value.lower()}",
-            "timestamp": tenant.created_at,
-        })
-
-    # Recent licenses
-    recent_licenses = db.query(License).order_by(License.issued_at.desc()).limit(limit).all()
-    for lic in recent_licenses:
-        tenant = db.query(Tenant).filter(Tenant.id == lic.tenant_id).first()
-        if tenant:
-            activities.append({
-                "id": str(lic.id),
-                "tenant_name": tenant.name,
-                "action": "license issued" if not lic.revoked else "license revoked",
-                "timestamp": lic.issued_at,
-            })
+    # Recent tenant creations and license events, merged in the database
+    recent_tenants = (
+        select(
+            Tenant.id.label("id"),
+            Tenant.name.label("tenant_name"),
+            ("started " + func.lower(cast(Tenant.status, String))).label("action"),
+            Tenant.created_at.label("timestamp"),
+        )
+        .order_by(Tenant.created_at.desc())
+        .limit(limit)
+    )
+
+    recent_licenses = (
+        select(
+            License.id.label("id"),
+            Tenant.name.label("tenant_name"),
+            case(
+                (License.revoked == True, "license revoked"),
+                else_="license issued",
+            ).label("action"),
+            License.issued_at.label("timestamp"),
+        )
+        .join(Tenant, Tenant.id == License.tenant_id)
+        .order_by(License.issued_at.desc())
+        .limit(limit)
+    )
 
     # Sort by timestamp and limit
-    activities.sort(key=lambda x: x["timestamp"], reverse=True)
-    return activities[:limit]
+    activities = db.execute(
+        union_all(recent_tenants, recent_licenses)
+        .order_by(desc("timestamp"))
+        .limit(limit)
+    ).all()
+
+    return [
+        {
+            "id": str(row.id),
+            "tenant_name": row.tenant_name,
+            "action": row.action,
+            "timestamp": row.timestamp,
+        }
+        for row in activities
+    ]
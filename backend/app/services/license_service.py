@@ -1,16 +1,21 @@
 import uuid
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, text
+from sqlalchemy.orm import Session, load_only
 from app.models.license import License, LicenseAuditLog
 from app.models.tenant import Tenant
 from app.schemas.license import LicenseCreate
 from app.core.config import settings
+from app.core import cache
+from app.services import dashboard_service
 from jose import jwt, JWTError
 import logging
 
 logger = logging.getLogger(__name__)
 
+VALIDATION_CACHE_TTL = 60  # seconds
+
 
 class LicenseValidationError(Exception):
     """Custom exception for license validation errors"""
@@ -21,8 +26,29 @@ class LicenseValidationError(Exception):
         super().__init__(self.message)
 
 
+def _validation_cache_key(tenant_slug: str) -> str:
+    return f"license:validate:tenant:{tenant_slug}"
+
+
+def invalidate_tenant_validation(db: Session, tenant_slug: str) -> None:
+    """Drop the cached by-slug validation once a license or tenant change commits"""
+    cache.delete_on_commit(db, _validation_cache_key(tenant_slug))
+
+
+# Columns exposed by the License list schema; revocation details, limits and
+# the features JSON are only read by validation and detail views
+_LIST_COLUMNS = load_only(
+    License.id,
+    License.tenant_id,
+    License.key_string,
+    License.issued_at,
+    License.expires_at,
+    License.revoked,
+)
+
+
 def get_licenses(db: Session, skip: int = 0, limit: int = 100) -> List[License]:
-    return db.query(License).offset(skip).limit(limit).all()
+    return db.query(License).options(_LIST_COLUMNS).offset(skip).limit(limit).all()
 
 
 def get_license_by_id(db: Session, license_id: str) -> Optional[License]:
@@ -30,7 +56,12 @@ def get_license_by_id(db: Session, license_id: str) -> Optional[License]:
 
 
 def get_licenses_by_tenant(db: Session, tenant_id: str) -> List[License]:
-    return db.query(License).filter(License.tenant_id == tenant_id).all()
+    return (
+        db.query(License)
+        .options(_LIST_COLUMNS)
+        .filter(License.tenant_id == tenant_id)
+        .all()
+    )
 
 
 def _map_tier_to_license_type(tier_value: str) -> str:
@@ -141,8 +172,9 @@ def generate_license(
     )
     db.add(audit)
 
-    db.commit()
-    db.refresh(db_license)
+    db.flush()
+    dashboard_service.invalidate_dashboard_stats(db)
+    invalidate_tenant_validation(db, tenant.slug)
     return db_license
 
 
@@ -168,8 +200,9 @@ def revoke_license(
     )
     db.add(audit)
 
-    db.commit()
-    db.refresh(db_license)
+    db.flush()
+    dashboard_service.invalidate_dashboard_stats(db)
+    invalidate_tenant_validation(db, db_license.tenant.slug)
     return db_license
 
 
@@ -183,6 +216,24 @@ def _map_tier_to_spec(tier_value: str) -> str:
     return tier_mapping.get(tier_value, tier_value.lower())
 
 
+# Columns read when building a validation response. The key_string (the JWT
+# the caller just sent) and unused tenant columns are not fetched.
+_VALIDATION_COLUMNS = (
+    load_only(
+        License.id,
+        License.tenant_id,
+        License.issued_at,
+        License.expires_at,
+        License.revoked,
+        License.revoked_at,
+        License.revocation_reason,
+        License.max_employees,
+        License.features,
+    ),
+    load_only(Tenant.id, Tenant.name, Tenant.slug, Tenant.tier),
+)
+
+
 def validate_license_key(
     db: Session,
     license_key: str,
@@ -202,14 +253,18 @@ def validate_license_key(
         logger.warning(f"License validation failed - invalid JWT: {e}")
         raise LicenseValidationError("Invalid license key format", "INVALID_FORMAT")
 
-    # Find the license in database
-    db_license = db.query(License).filter(License.key_string == license_key).first()
-    if not db_license:
+    # Find the license and its tenant in one query
+    row = (
+        db.query(License, Tenant)
+        .outerjoin(Tenant, Tenant.id == License.tenant_id)
+        .options(*_VALIDATION_COLUMNS)
+        .filter(License.key_string == license_key)
+        .first()
+    )
+    if not row:
         logger.warning("License validation failed - license not found in database")
         raise LicenseValidationError("License not found", "NOT_FOUND")
-
-    # Get tenant info
-    tenant = db.query(Tenant).filter(Tenant.id == db_license.tenant_id).first()
+    db_license, tenant = row
 
     # Check if revoked - return revoked info instead of raising error
     if db_license.revoked:
@@ -221,20 +276,20 @@ def validate_license_key(
             "revoked": True,
             "revocation_reason": db_license.revocation_reason
             or "License has been revoked",
-            "revoked_at": db_license.revoked_at.isoformat()
-            if db_license.revoked_at
-            else None,
+            "revoked_at": db_license.revoked_at,
             "license_tier": _map_tier_to_spec(tenant.tier.value)
             if tenant
             else "starter",
             "company_name": tenant.name if tenant else "Unknown",
             "max_employees": db_license.max_employees,
-            "expires_at": db_license.expires_at.isoformat(),
+            "expires_at": db_license.expires_at,
             "features": db_license.features or [],
         }
 
+    now = datetime.utcnow()
+
     # Check if expired
-    if db_license.expires_at < datetime.utcnow():
+    if db_license.expires_at < now:
         logger.warning(
             f"License validation failed - license {db_license.id} is expired"
         )
@@ -246,13 +301,16 @@ def validate_license_key(
         action="VALIDATED",
         performed_by="api",
         details={
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": now.isoformat(),
             "installation_id": installation_id,
             "hardware_fingerprint": hardware_fingerprint,
         },
     )
+    # VALIDATED rows are high-volume telemetry, so this transaction does not
+    # wait for the WAL flush. A crash can lose the last few rows; it cannot
+    # corrupt them. The request-level commit in get_db persists the row.
+    db.execute(text("SET LOCAL synchronous_commit TO OFF"))
     db.add(audit)
-    db.commit()
 
     # Return response matching ChurnVision integration specification
     return {
@@ -260,7 +318,7 @@ def validate_license_key(
         "license_tier": _map_tier_to_spec(tenant.tier.value) if tenant else "starter",
         "company_name": tenant.name if tenant else "Unknown",
         "max_employees": db_license.max_employees,
-        "expires_at": db_license.expires_at.isoformat(),
+        "expires_at": db_license.expires_at,
         "features": db_license.features or [],
         "revoked": False,
         "revocation_reason": None,
@@ -269,43 +327,59 @@ def validate_license_key(
         "license_id": str(db_license.id),
         "tenant_id": str(db_license.tenant_id),
         "tenant_slug": tenant.slug if tenant else None,
-        "issued_at": db_license.issued_at.isoformat(),
-        "days_until_expiry": (db_license.expires_at - datetime.utcnow()).days,
+        "issued_at": db_license.issued_at,
+        "days_until_expiry": (db_license.expires_at - now).days,
     }
 
 
 def validate_license_by_tenant_slug(db: Session, tenant_slug: str) -> Dict[str, Any]:
     """
     Validate the active license for a tenant by slug.
-    Returns the most recent valid license for the tenant.
+    Returns the most recent valid license for the tenant; the license side
+    of the join is served by ix_license_tenant_active.
     Response format matches the ChurnVision integration specification.
-    """
-    tenant = db.query(Tenant).filter(Tenant.slug == tenant_slug).first()
-    if not tenant:
-        raise LicenseValidationError("Tenant not found", "TENANT_NOT_FOUND")
 
-    # Get the most recent active license
-    db_license = (
-        db.query(License)
-        .filter(
-            License.tenant_id == tenant.id,
-            License.revoked == False,
-            License.expires_at > datetime.utcnow(),
+    Successful results are cached per slug for VALIDATION_CACHE_TTL seconds;
+    license and tenant mutations invalidate the entry.
+    """
+    cache_key = _validation_cache_key(tenant_slug)
+    cached = cache.get_json(cache_key)
+    if cached is not None:
+        return cached
+
+    now = datetime.utcnow()
+
+    # Tenant and its most recent active license in one query; the outer join
+    # yields a NULL license when the tenant has none
+    row = (
+        db.query(Tenant, License)
+        .options(*_VALIDATION_COLUMNS)
+        .outerjoin(
+            License,
+            and_(
+                License.tenant_id == Tenant.id,
+                License.revoked == False,
+                License.expires_at > now,
+            ),
         )
+        .filter(Tenant.slug == tenant_slug)
         .order_by(License.expires_at.desc())
         .first()
     )
+    if not row:
+        raise LicenseValidationError("Tenant not found", "TENANT_NOT_FOUND")
+    tenant, db_license = row
 
     if not db_license:
         raise LicenseValidationError("No valid license found for tenant", "NO_LICENSE")
 
     # Return response matching ChurnVision integration specification
-    return {
+    result = {
         "valid": True,
         "license_tier": _map_tier_to_spec(tenant.tier.value),
         "company_name": tenant.name,
         "max_employees": db_license.max_employees,
-        "expires_at": db_license.expires_at.isoformat(),
+        "expires_at": db_license.expires_at,
         "features": db_license.features or [],
         "revoked": False,
         "revocation_reason": None,
@@ -314,9 +388,14 @@ def validate_license_by_tenant_slug(db: Session, tenant_slug: str) -> Dict[str,
         "license_id": str(db_license.id),
         "tenant_id": str(tenant.id),
         "tenant_slug": tenant.slug,
-        "issued_at": db_license.issued_at.isoformat(),
-        "days_until_expiry": (db_license.expires_at - datetime.utcnow()).days,
+        "issued_at": db_license.issued_at,
+        "days_until_expiry": (db_license.expires_at - now).days,
     }
+    # Never serve a cached "valid" past the license's own expiry
+    ttl = min(VALIDATION_CACHE_TTL, int((db_license.expires_at - now).total_seconds()))
+    if ttl > 0:
+        cache.set_json(cache_key, result, ttl)
+    return result
 
 
 def get_license_audit_logs(
@@ -359,6 +438,7 @@ def extend_license(
     )
     db.add(audit)
 
-    db.commit()
-    db.refresh(db_license)
+    db.flush()
+    dashboard_service.invalidate_dashboard_stats(db)
+    invalidate_tenant_validation(db, db_license.tenant.slug)
     return db_license
@@ -2,6 +2,7 @@ from datetime import datetime
 from sqlalchemy.orm import Session
 from app.models.release import Release, ReleaseStatus
 from app.schemas.release import ReleaseCreate, ReleaseUpdate
+from app.services import dashboard_service
 
 def create_release(db: Session, release_in: ReleaseCreate) -> Release:
     db_release = Release(
@@ -17,8 +18,8 @@ def create_release(db: Session, release_in: ReleaseCreate) -> Release:
         db_release.published_at = datetime.utcnow()
         
     db.add(db_release)
-    db.commit()
-    db.refresh(db_release)
+    db.flush()
+    dashboard_service.invalidate_dashboard_stats(db)
     return db_release
 
 def get_releases(db: Session, skip: int = 0, limit: int = 100):
@@ -36,6 +37,6 @@ def update_release(db: Session, release: Release, release_in: ReleaseUpdate) ->
         release.published_at = datetime.utcnow()
         
     db.add(release)
-    db.commit()
-    db.refresh(release)
+    db.flush()
+    dashboard_service.invalidate_dashboard_stats(db)
     return release
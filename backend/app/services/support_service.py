@@ -26,8 +26,7 @@ def create_ticket(db: Session, ticket_in: TicketCreate) -> Ticket:
         priority=ticket_in.priority
     )
     db.add(db_ticket)
-    db.commit()
-    db.refresh(db_ticket)
+    db.flush()
     return db_ticket
 
 
@@ -36,16 +35,14 @@ def update_ticket(db: Session, ticket: Ticket, ticket_in: TicketUpdate) -> Ticke
     for field, value in update_data.items():
         setattr(ticket, field, value)
     ticket.updated_at = datetime.utcnow()
-    db.commit()
-    db.refresh(ticket)
+    db.flush()
     return ticket
 
 
 def close_ticket(db: Session, ticket: Ticket) -> Ticket:
     ticket.status = "CLOSED"
     ticket.updated_at = datetime.utcnow()
-    db.commit()
-    db.refresh(ticket)
+    db.flush()
     return ticket
 
 
@@ -69,8 +66,7 @@ def create_announcement(db: Session, announce_in: AnnouncementCreate) -> Announc
         expires_at=announce_in.expires_at
     )
     db.add(db_ann)
-    db.commit()
-    db.refresh(db_ann)
+    db.flush()
     return db_ann
 
 
@@ -78,11 +74,10 @@ def update_announcement(db: Session, announcement: Announcement, announce_in: An
     update_data = announce_in.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(announcement, field, value)
-    db.commit()
-    db.refresh(announcement)
+    db.flush()
     return announcement
 
 
 def delete_announcement(db: Session, announcement: Announcement) -> None:
     db.delete(announcement)
-    db.commit()
+    db.flush()
@@ -20,8 +20,7 @@ def record_ping(db: Session, ping_in: TelemetryPingCreate) -> TelemetryPing:
         recent_errors=ping_in.recent_errors,
     )
     db.add(db_ping)
-    db.commit()
-    db.refresh(db_ping)
+    db.flush()
     return db_ping
 
 
@@ -55,6 +54,5 @@ def record_ping_from_spec(
     # Or add installation_id, error_count_24h to the model in future migration
 
     db.add(db_ping)
-    db.commit()
-    db.refresh(db_ping)
+    db.flush()
     return db_ping
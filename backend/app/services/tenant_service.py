@@ -1,16 +1,33 @@
 from typing import Optional, List, Dict, Any
 from datetime import datetime
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, contains_eager, joinedload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 from app.models.tenant import (
     Tenant,
     TenantContact,
     TenantConfig,
     TenantDeployment,
+    TenantDeploymentHealth,
     TenantStatus,
+    DeploymentStatus,
 )
 from app.schemas.tenant import TenantCreate, TenantUpdate
 from app.schemas.license import LicenseCreate
-from app.services import license_service
+from app.services import license_service, dashboard_service
+from app.core import cache
+
+TENANT_CONFIGS_CACHE_TTL = 60  # seconds
+
+
+def _configs_cache_key(tenant_id) -> str:
+    return f"tenant:configs:{tenant_id}"
+
+
+def invalidate_tenant_configs(db: Session, tenant_id) -> None:
+    """Drop the cached structured configs once a config or limits change commits"""
+    cache.delete_on_commit(db, _configs_cache_key(tenant_id))
 
 
 def create_tenant(
@@ -19,28 +36,7 @@ def create_tenant(
     """
     Create a new tenant and optionally auto-generate a license.
     """
-    # Default features based on tier
-    tier_features = {
-        "STARTER": ["home", "data-management", "settings"],
-        "PROFESSIONAL": [
-            "home",
-            "data-management",
-            "settings",
-            "ai-assistant",
-            "knowledge-base",
-        ],
-        "ENTERPRISE": [
-            "home",
-            "data-management",
-            "settings",
-            "ai-assistant",
-            "knowledge-base",
-            "playground",
-            "gdpr",
-        ],
-    }
-
-    features = tier_features.get(tenant_in.tier.value, [])
+    features = list(tenant_in.tier.features)
 
     db_tenant = Tenant(
         name=tenant_in.name,
@@ -54,8 +50,8 @@ def create_tenant(
         max_users=tenant_in.max_users or 5,
     )
     db.add(db_tenant)
-    db.commit()
-    db.refresh(db_tenant)
+    db.flush()
+    dashboard_service.invalidate_dashboard_stats(db)
 
     # Auto-generate license for the new tenant
     if auto_generate_license:
@@ -74,7 +70,14 @@ def create_tenant(
 
 
 def get_tenants(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(Tenant).offset(skip).limit(limit).all()
+    # The Tenant schema renders contacts; load them for the page in one IN query
+    return (
+        db.query(Tenant)
+        .options(selectinload(Tenant.contacts))
+        .offset(skip)
+        .limit(limit)
+        .all()
+    )
 
 
 def get_tenant_by_slug(db: Session, slug: str) -> Optional[Tenant]:
@@ -86,17 +89,25 @@ def get_tenant_by_id(db: Session, tenant_id: str) -> Optional[Tenant]:
 
 
 def update_tenant(db: Session, tenant: Tenant, tenant_in: TenantUpdate) -> Tenant:
+    old_slug = tenant.slug
     update_data = tenant_in.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(tenant, field, value)
-    db.commit()
-    db.refresh(tenant)
+    db.flush()
+    dashboard_service.invalidate_dashboard_stats(db)
+    license_service.invalidate_tenant_validation(db, old_slug)
+    invalidate_tenant_configs(db, tenant.id)
     return tenant
 
 
 def delete_tenant(db: Session, tenant: Tenant) -> None:
+    slug = tenant.slug
+    tenant_id = tenant.id
     db.delete(tenant)
-    db.commit()
+    db.flush()
+    dashboard_service.invalidate_dashboard_stats(db)
+    license_service.invalidate_tenant_validation(db, slug)
+    invalidate_tenant_configs(db, tenant_id)
 
 
 # ===== Tenant Config Management =====
@@ -119,24 +130,30 @@ def get_tenant_config(db: Session, tenant_id: str, key: str) -> Optional[TenantC
 def set_tenant_config(
     db: Session, tenant_id: str, key: str, value: str
 ) -> TenantConfig:
-    """Set or update a config value for a tenant"""
-    config = get_tenant_config(db, tenant_id, key)
-    if config:
-        config.value = value
-    else:
-        config = TenantConfig(tenant_id=tenant_id, key=key, value=value)
-        db.add(config)
-    db.commit()
-    db.refresh(config)
+    """Set or update a config value for a tenant (one upsert, committed by get_db)"""
+    config = db.scalars(
+        pg_insert(TenantConfig)
+        .values(tenant_id=tenant_id, key=key, value=value)
+        .on_conflict_do_update(
+            constraint="uq_tenant_configs_tenant_id_key",
+            set_={"value": value},
+        )
+        .returning(TenantConfig),
+        execution_options={"populate_existing": True},
+    ).one()
+    invalidate_tenant_configs(db, tenant_id)
     return config
 
 
 def delete_tenant_config(db: Session, tenant_id: str, key: str) -> bool:
-    """Delete a config entry for a tenant"""
-    config = get_tenant_config(db, tenant_id, key)
-    if config:
-        db.delete(config)
-        db.commit()
+    """Delete a config entry for a tenant (one DELETE, committed by get_db)"""
+    result = db.execute(
+        delete(TenantConfig)
+        .where(TenantConfig.tenant_id == tenant_id, TenantConfig.key == key)
+        .execution_options(synchronize_session="fetch")
+    )
+    if result.rowcount:
+        invalidate_tenant_configs(db, tenant_id)
         return True
     return False
 
@@ -147,21 +164,48 @@ def get_tenant_configs_as_dict(db: Session, tenant_id: str) -> Dict[str, str]:
     return {c.key: c.value for c in configs}
 
 
+# Config keys mapped into the structured sections; anything else is "custom"
+_KNOWN_CONFIG_KEYS = frozenset(
+    {
+        "enable_ai_assistant",
+        "enable_playground",
+        "enable_knowledge_base",
+        "enable_gdpr",
+        "max_concurrent_users",
+        "company_logo_url",
+        "primary_color",
+        "max_predictions_per_day",
+    }
+)
+_TRUE_VALUES = frozenset({"true", "1", "yes", "on"})
+
+
 def get_tenant_configs_structured(db: Session, tenant_id: str) -> Dict[str, Any]:
     """
     Get tenant configs as a structured dictionary.
     Organizes configs into feature_flags, branding, and limits sections.
     Matches the ChurnVision integration specification.
-    """
-    configs = get_tenant_configs(db, tenant_id)
-    config_dict = {c.key: c.value for c in configs}
 
-    # Get tenant for limits
-    tenant = get_tenant_by_id(db, tenant_id)
+    Cached per tenant for TENANT_CONFIGS_CACHE_TTL seconds; config and
+    tenant writes invalidate the entry.
+    """
+    cache_key = _configs_cache_key(tenant_id)
+    cached = cache.get_json(cache_key)
+    if cached is not None:
+        return cached
+
+    # Tenant (for limits) and its configs in a single query
+    tenant = (
+        db.query(Tenant)
+        .options(joinedload(Tenant.configs))
+        .filter(Tenant.id == tenant_id)
+        .first()
+    )
+    config_dict = {c.key: c.value for c in tenant.configs} if tenant else {}
 
     # Parse boolean/int values from string configs
     def parse_bool(val: str) -> bool:
-        return val.lower() in ("true", "1", "yes", "on")
+        return val.lower() in _TRUE_VALUES
 
     def parse_int(val: str, default: int = 0) -> int:
         try:
@@ -200,26 +244,27 @@ def get_tenant_configs_structured(db: Session, tenant_id: str) -> Dict[str, Any]
     }
 
     # Add any additional custom configs under a separate key
-    known_keys = {
-        "enable_ai_assistant",
-        "enable_playground",
-        "enable_knowledge_base",
-        "enable_gdpr",
-        "max_concurrent_users",
-        "company_logo_url",
-        "primary_color",
-        "max_predictions_per_day",
+    custom_configs = {
+        k: v for k, v in config_dict.items() if k not in _KNOWN_CONFIG_KEYS
     }
-    custom_configs = {k: v for k, v in config_dict.items() if k not in known_keys}
     if custom_configs:
         result["custom"] = custom_configs
 
+    cache.set_json(cache_key, result, TENANT_CONFIGS_CACHE_TTL)
     return result
 
 
 # ===== Tenant Deployment Management =====
 
 
+def _parse_deployment_status(status: str) -> DeploymentStatus:
+    """Map a reported status string onto DeploymentStatus (UNKNOWN if unrecognised)"""
+    try:
+        return DeploymentStatus(status.upper())
+    except ValueError:
+        return DeploymentStatus.UNKNOWN
+
+
 def get_tenant_deployment(db: Session, tenant_id: str) -> Optional[TenantDeployment]:
     """Get current deployment info for a tenant"""
     return (
@@ -229,6 +274,27 @@ def get_tenant_deployment(db: Session, tenant_id: str) -> Optional[TenantDeploym
     )
 
 
+def _upsert_deployment_health(
+    db: Session,
+    tenant_id: str,
+    values: Dict[str, Any],
+    updates: Dict[str, Any],
+) -> TenantDeploymentHealth:
+    """Insert or update the health row of a tenant's deployment in one statement"""
+    deployment_id = (
+        select(TenantDeployment.id)
+        .where(TenantDeployment.tenant_id == tenant_id)
+        .scalar_subquery()
+    )
+    return db.scalars(
+        pg_insert(TenantDeploymentHealth)
+        .values(deployment_id=deployment_id, **values)
+        .on_conflict_do_update(index_elements=["deployment_id"], set_=updates)
+        .returning(TenantDeploymentHealth),
+        execution_options={"populate_existing": True},
+    ).one()
+
+
 def update_tenant_deployment(
     db: Session,
     tenant_id: str,
@@ -237,24 +303,26 @@ def update_tenant_deployment(
     environment: str = "production",
 ) -> TenantDeployment:
     """Update or create deployment info for a tenant"""
-    deployment = get_tenant_deployment(db, tenant_id)
-    if deployment:
-        deployment.current_version = version
-        deployment.deployed_at = datetime.utcnow()
-        deployment.deployed_by = deployed_by
-        deployment.environment = environment
-        deployment.status = "DEPLOYED"
-    else:
-        deployment = TenantDeployment(
-            tenant_id=tenant_id,
-            current_version=version,
-            deployed_by=deployed_by,
-            environment=environment,
-            status="DEPLOYED",
+    fields = {
+        "current_version": version,
+        "deployed_at": datetime.utcnow(),
+        "deployed_by": deployed_by,
+        "environment": environment,
+    }
+    deployment = db.scalars(
+        pg_insert(TenantDeployment)
+        .values(tenant_id=tenant_id, **fields)
+        .on_conflict_do_update(
+            constraint="uq_tenant_deployments_tenant_id", set_=fields
         )
-        db.add(deployment)
-    db.commit()
-    db.refresh(deployment)
+        .returning(TenantDeployment),
+        execution_options={"populate_existing": True},
+    ).one()
+
+    deployed = {"status": DeploymentStatus.DEPLOYED}
+    health = _upsert_deployment_health(db, tenant_id, deployed, deployed)
+    # The RETURNING row has no eager loads; attach health for the schema
+    set_committed_value(deployment, "health", health)
     return deployment
 
 
@@ -264,10 +332,11 @@ def update_deployment_health(
     """Update health status for a tenant deployment (basic version)"""
     deployment = get_tenant_deployment(db, tenant_id)
     if deployment:
-        deployment.last_health_check = datetime.utcnow()
-        deployment.status = status
-        db.commit()
-        db.refresh(deployment)
+        if not deployment.health:
+            deployment.health = TenantDeploymentHealth()
+        deployment.health.last_health_check = datetime.utcnow()
+        deployment.health.status = _parse_deployment_status(status)
+        db.flush()
     return deployment
 
 
@@ -283,63 +352,70 @@ def update_deployment_health_extended(
     python_version: str = None,
     installation_id: str = None,
     reported_at: datetime = None,
-) -> Optional[TenantDeployment]:
+) -> TenantDeploymentHealth:
     """
     Update health status for a tenant deployment with extended fields.
 
     Privacy-focused: Only status, version, and uptime_seconds are required.
     Other fields (database_healthy, cache_healthy, platform, python_version)
     are optional for backwards compatibility.
+
+    Per-ping fields are upserted into the narrow TenantDeploymentHealth row;
+    the deployment row is created if missing and otherwise only rewritten
+    when an identity field actually changes.
     """
-    deployment = get_tenant_deployment(db, tenant_id)
     now = datetime.utcnow()
 
-    if deployment:
-        deployment.last_health_check = now
-        deployment.status = status.upper()
-
-        # Update version if provided
-        if version:
-            deployment.current_version = version
-
-        # Update uptime (always provided)
-        deployment.uptime_seconds = uptime_seconds
-
-        # Update optional extended health fields only if provided
-        if database_healthy is not None:
-            deployment.database_healthy = database_healthy
-        if cache_healthy is not None:
-            deployment.cache_healthy = cache_healthy
-        if platform:
-            deployment.platform = platform
-        if python_version:
-            deployment.python_version = python_version
-        if installation_id:
-            deployment.installation_id = installation_id
-        deployment.last_reported_at = reported_at or now
-
-        db.commit()
-        db.refresh(deployment)
+    # Only fields that were provided overwrite the stored deployment
+    identity = {
+        "current_version": version,
+        "platform": platform,
+        "python_version": python_version,
+        "installation_id": installation_id,
+    }
+    changed = {k: v for k, v in identity.items() if v}
+    stmt = pg_insert(TenantDeployment).values(
+        tenant_id=tenant_id,
+        current_version=version or "unknown",
+        platform=platform,
+        python_version=python_version,
+        installation_id=installation_id,
+    )
+    if changed:
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_tenant_deployments_tenant_id",
+            set_=changed,
+            where=or_(
+                *(
+                    getattr(TenantDeployment, k).is_distinct_from(v)
+                    for k, v in changed.items()
+                )
+            ),
+        )
     else:
-        # Auto-create deployment if it doesn't exist
-        deployment = TenantDeployment(
-            tenant_id=tenant_id,
-            current_version=version or "unknown",
-            status=status.upper(),
-            last_health_check=now,
-            database_healthy=database_healthy,  # May be None
-            cache_healthy=cache_healthy,  # May be None
-            uptime_seconds=uptime_seconds,
-            platform=platform,
-            python_version=python_version,
-            installation_id=installation_id,
-            last_reported_at=reported_at or now,
+        stmt = stmt.on_conflict_do_nothing(
+            constraint="uq_tenant_deployments_tenant_id"
         )
-        db.add(deployment)
-        db.commit()
-        db.refresh(deployment)
+    db.execute(stmt)
 
-    return deployment
+    health = {
+        "status": _parse_deployment_status(status),
+        "last_health_check": now,
+        "uptime_seconds": uptime_seconds,
+        "last_reported_at": reported_at or now,
+    }
+    updates = dict(health)
+    # Update optional extended health fields only if provided
+    if database_healthy is not None:
+        updates["database_healthy"] = database_healthy
+    if cache_healthy is not None:
+        updates["cache_healthy"] = cache_healthy
+    values = {
+        **health,
+        "database_healthy": database_healthy,  # May be None
+        "cache_healthy": cache_healthy,  # May be None
+    }
+    return _upsert_deployment_health(db, tenant_id, values, updates)
 
 
 def get_all_deployments(
@@ -362,6 +438,12 @@ def get_unhealthy_deployments(db: Session) -> List[TenantDeployment]:
     """Get all deployments with non-healthy status"""
     return (
         db.query(TenantDeployment)
-        .filter(TenantDeployment.status.notin_(["HEALTHY", "DEPLOYED"]))
+        .join(TenantDeployment.health)
+        .options(contains_eager(TenantDeployment.health))
+        .filter(
+            TenantDeploymentHealth.status.notin_(
+                [DeploymentStatus.HEALTHY, DeploymentStatus.DEPLOYED]
+            )
+        )
         .all()
     )
@@ -19,8 +19,7 @@ def create_user(db: Session, user_in: UserCreate) -> User:
         is_superuser=user_in.is_superuser,
     )
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    db.flush()
     return db_user
 
 def update_user(db: Session, user: User, user_in: UserUpdate) -> User:
@@ -29,8 +28,7 @@ def update_user(db: Session, user: User, user_in: UserUpdate) -> User:
         update_data["hashed_password"] = get_password_hash(update_data.pop("password"))
     for field, value in update_data.items():
         setattr(user, field, value)
-    db.commit()
-    db.refresh(user)
+    db.flush()
     return user
 
 def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
@@ -1,9 +1,10 @@
-import hashlib
+import asyncio
 import hmac
 import json
 import logging
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
+from sqlalchemy import tuple_
 from sqlalchemy.orm import Session
 import httpx
 
@@ -15,6 +16,33 @@ logger = logging.getLogger(__name__)
 # Timeout for webhook delivery
 WEBHOOK_TIMEOUT = 10.0  # seconds
 
+# Characters of the endpoint's response kept on the delivery record
+RESPONSE_BODY_LIMIT = 1000
+
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Shared client for webhook deliveries, so repeated deliveries to the same
+    host reuse pooled connections instead of a new TCP/TLS handshake each.
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=WEBHOOK_TIMEOUT,
+            limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared client on application shutdown"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
 
 def get_webhooks(db: Session, skip: int = 0, limit: int = 100) -> List[Webhook]:
     return db.query(Webhook).offset(skip).limit(limit).all()
@@ -51,8 +79,7 @@ def create_webhook(db: Session, webhook_in: WebhookCreate) -> Webhook:
         tenant_id=webhook_in.tenant_id,
     )
     db.add(db_webhook)
-    db.commit()
-    db.refresh(db_webhook)
+    db.flush()
     return db_webhook
 
 
@@ -60,38 +87,61 @@ def update_webhook(db: Session, webhook: Webhook, webhook_in: WebhookUpdate) ->
     update_data = webhook_in.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(webhook, field, value)
-    db.commit()
-    db.refresh(webhook)
+    db.flush()
     return webhook
 
 
 def delete_webhook(db: Session, webhook: Webhook) -> None:
     db.delete(webhook)
-    db.commit()
+    db.flush()
 
 
-def generate_signature(payload: str, secret: str) -> str:
-    """Generate HMAC-SHA256 signature for webhook payload"""
-    return hmac.new(
-        secret.encode('utf-8'),
-        payload.encode('utf-8'),
-        hashlib.sha256
-    ).hexdigest()
+def generate_signature(payload: bytes, secret: str) -> str:
+    """Generate HMAC-SHA256 signature for an encoded webhook payload"""
+    return hmac.digest(secret.encode('utf-8'), payload, "sha256").hex()
 
 
-async def deliver_webhook(
-    db: Session,
-    webhook: Webhook,
-    event_type: str,
-    data: Dict[str, Any]
-) -> WebhookDelivery:
-    """Deliver a webhook event to the registered URL"""
+def build_payload(event_type: str, data: Dict[str, Any]) -> Tuple[Dict[str, Any], bytes]:
+    """Build an event payload and its encoded body, shared by all subscribers"""
     payload = {
         "event_type": event_type,
         "timestamp": datetime.utcnow().isoformat(),
         "data": data
     }
-    payload_json = json.dumps(payload)
+    return payload, json.dumps(payload).encode('utf-8')
+
+
+async def _read_response_head(response: httpx.Response) -> Optional[str]:
+    """
+    Read only as much of the response as the delivery record keeps, so an
+    endpoint answering with a huge body is not buffered in full.
+    """
+    head = bytearray()
+    async for chunk in response.aiter_bytes():
+        head += chunk
+        # UTF-8 needs at most 4 bytes per character
+        if len(head) >= RESPONSE_BODY_LIMIT * 4:
+            break
+    if not head:
+        return None
+    text = head.decode(response.encoding or "utf-8", errors="replace")
+    return text[:RESPONSE_BODY_LIMIT]
+
+
+async def deliver_webhook(
+    db: Session,
+    webhook: Webhook,
+    event_type: str,
+    data: Dict[str, Any],
+    prepared: Optional[Tuple[Dict[str, Any], bytes]] = None,
+) -> WebhookDelivery:
+    """
+    Deliver a webhook event to the registered URL.
+    `prepared` is a (payload, body) pair from build_payload, so fan-out
+    encodes the event once. The delivery record is added to the session;
+    the caller flushes it.
+    """
+    payload, body = prepared or build_payload(event_type, data)
 
     headers = {
         "Content-Type": "application/json",
@@ -100,7 +150,7 @@ async def deliver_webhook(
 
     # Add signature if secret is configured
     if webhook.secret:
-        signature = generate_signature(payload_json, webhook.secret)
+        signature = generate_signature(body, webhook.secret)
         headers["X-Webhook-Signature"] = f"sha256={signature}"
 
     delivery = WebhookDelivery(
@@ -111,14 +161,14 @@ async def deliver_webhook(
     )
 
     try:
-        async with httpx.AsyncClient(timeout=WEBHOOK_TIMEOUT) as client:
-            response = await client.post(
-                webhook.url,
-                content=payload_json,
-                headers=headers,
-            )
+        async with get_http_client().stream(
+            "POST",
+            webhook.url,
+            content=body,
+            headers=headers,
+        ) as response:
             delivery.response_status = str(response.status_code)
-            delivery.response_body = response.text[:1000] if response.text else None
+            delivery.response_body = await _read_response_head(response)
             delivery.success = 200 <= response.status_code < 300
 
     except httpx.TimeoutException:
@@ -128,12 +178,10 @@ async def deliver_webhook(
 
     except httpx.RequestError as e:
         delivery.response_status = "ERROR"
-        delivery.response_body = str(e)[:1000]
+        delivery.response_body = str(e)[:RESPONSE_BODY_LIMIT]
         logger.error(f"Webhook delivery error: {webhook.url} - {e}")
 
     db.add(delivery)
-    db.commit()
-    db.refresh(delivery)
     return delivery
 
 
@@ -143,17 +191,31 @@ async def trigger_event(
     data: Dict[str, Any],
     tenant_id: Optional[str] = None
 ) -> List[WebhookDelivery]:
-    """Trigger an event and deliver to all subscribed webhooks"""
+    """
+    Trigger an event and deliver to all subscribed webhooks concurrently.
+    All deliveries share the request's Session, so the fan-out holds one
+    pooled connection no matter how many webhooks are subscribed.
+    """
     webhooks = get_active_webhooks_for_event(db, event_type, tenant_id)
-    deliveries = []
-
-    for webhook in webhooks:
-        try:
-            delivery = await deliver_webhook(db, webhook, event_type, data)
-            deliveries.append(delivery)
-        except Exception as e:
-            logger.error(f"Failed to deliver webhook {webhook.id}: {e}")
+    prepared = build_payload(event_type, data)
+
+    results = await asyncio.gather(
+        *(
+            deliver_webhook(db, webhook, event_type, data, prepared)
+            for webhook in webhooks
+        ),
+        return_exceptions=True,
+    )
 
+    deliveries = []
+    for webhook, result in zip(webhooks, results):
+        if isinstance(result, Exception):
+            logger.error(f"Failed to deliver webhook {webhook.id}: {result}")
+        else:
+            deliveries.append(result)
+
+    # All delivery records are written in one flush
+    db.flush()
     return deliveries
 
 
@@ -161,13 +223,30 @@ def get_webhook_deliveries(
     db: Session,
     webhook_id: str,
     skip: int = 0,
-    limit: int = 100
+    limit: int = 100,
+    before: Optional[datetime] = None,
+    before_id: Optional[str] = None,
 ) -> List[WebhookDelivery]:
-    """Get delivery history for a webhook"""
+    """
+    Get delivery history for a webhook, newest first.
+    Pass the delivered_at and id of the last row seen as before/before_id
+    to fetch the next page without scanning the skipped rows.
+    """
+    query = db.query(WebhookDelivery).filter(WebhookDelivery.webhook_id == webhook_id)
+    if before is not None:
+        if before_id is not None:
+            query = query.filter(
+                tuple_(WebhookDelivery.delivered_at, WebhookDelivery.id)
+                < tuple_(
+                    before,
+                    before_id,
+                    types=[WebhookDelivery.delivered_at.type, WebhookDelivery.id.type],
+                )
+            )
+        else:
+            query = query.filter(WebhookDelivery.delivered_at < before)
     return (
-        db.query(WebhookDelivery)
-        .filter(WebhookDelivery.webhook_id == webhook_id)
-        .order_by(WebhookDelivery.delivered_at.desc())
+        query.order_by(WebhookDelivery.delivered_at.desc(), WebhookDelivery.id.desc())
         .offset(skip)
         .limit(limit)
         .all()